@@ -7,6 +7,11 @@ import math
 from dataclasses import dataclass
 from typing import List, Tuple
 
+import numpy as np
+
+
+SCHUMANN_HZ = np.array([7.83, 14.3, 20.8, 27.3, 33.8])
+
 
 @dataclass
 class ResonantCavity:
@@ -16,22 +21,16 @@ class ResonantCavity:
     shape_type: str = "hexagonal_prism"
     
     def calculate_modes(self, max_harmonic: int = 5) -> List[float]:
-        modes = []
-        for n in range(1, max_harmonic + 1):
-            mode = self.fundamental_hz * n * math.sqrt(
-                sum(1/d**2 for d in self.dimensions)
-            ) / math.sqrt(3)
-            modes.append(mode)
-        return modes
+        coeff = self.fundamental_hz * math.sqrt(
+            sum(1/d**2 for d in self.dimensions)
+        ) / math.sqrt(3)
+        return [coeff * n for n in range(1, max_harmonic + 1)]
     
     def schumann_alignment(self) -> bool:
-        schumann = [7.83, 14.3, 20.8, 27.3, 33.8]
         modes = self.calculate_modes()
         tolerance = 0.5
-        for s in schumann:
-            if any(abs(m - s) < tolerance for m in modes):
-                return True
-        return False
+        deltas = np.abs(np.array(modes)[:, None] - SCHUMANN_HZ[None, :])
+        return bool((deltas < tolerance).any())
 
 
 class HexagonalTessellation:
@@ -0,0 +1,10 @@
+"""
+harmonic-balance/harmonic_compat.py
+Python version compatibility helpers shared across the packages.
+"""
+
+import sys
+
+# dataclass(slots=True) needs Python 3.10+; fall back to dict-backed
+# instances on 3.9. Use as @dataclass(**DATACLASS_SLOTS).
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
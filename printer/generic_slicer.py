@@ -5,11 +5,61 @@ Works with WASP Crane and other large-format earth printers.
 """
 
 import math
-from typing import List, Dict, Optional, Tuple
+import os
+import string
+from typing import Iterator, List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
 
+# Bytes accumulated before each os.write() in the streaming writers
+_WRITE_CHUNK_BYTES = 64 * 1024
+
+# Unit hexagon vertices (6 corners + return to start), shared by every ring
+_HEX_COS = tuple(math.cos(i * math.pi / 3) for i in range(7))
+_HEX_SIN = tuple(math.sin(i * math.pi / 3) for i in range(7))
+
+_HEADER_TEMPLATE = string.Template("""\
+; ============================================
+; Harmonic Habitats - Earth Construction G-code
+; Generated for $name or compatible earth printer
+; Firmware: Marlin (standard earth printing profile)
+; ============================================
+
+; Printer Specifications:
+;   Reach radius: ${reach}m
+;   Max height: ${height}m
+;   Nozzle diameter: ${nozzle}mm
+;   Layer height: ${layer}mm
+;   Print speed: ${speed}mm/s
+
+; Material: $material
+
+; Startup sequence
+G21 ; Set units to millimeters
+G90 ; Absolute positioning
+M82 ; Absolute extrusion (for paste extruders)
+G28 ; Home all axes
+G1 Z50 F3000 ; Move to safe height
+M400 ; Wait for moves to complete
+
+; Material preparation (manual)
+; 1. Load earth mix into hopper
+; 2. Prime extruder until consistent flow
+; 3. Verify nozzle clearance (paper test)
+M0 Click to begin printing... ; Pause for operator
+""")
+
+_FOOTER_LINES = (
+    "",
+    "; Print complete",
+    "M400 ; Wait for moves to complete",
+    "G28 ; Home all axes",
+    "M0 Print complete - clean nozzle and power down ; Final pause",
+    "M84 ; Disable motors",
+)
+
+
 class PrinterType(Enum):
     """Supported printer types."""
     WASP_CRANE = "wasp_crane"
@@ -82,49 +132,19 @@ class GenericSlicer:
         
     def generate_header(self, material: str = "local_earth_mix") -> List[str]:
         """Generate Marlin-compatible G-code header."""
-        lines = [
-            "; ============================================",
-            "; Harmonic Habitats - Earth Construction G-code",
-            f"; Generated for {self.config.name} or compatible earth printer",
-            "; Firmware: Marlin (standard earth printing profile)",
-            "; ============================================",
-            "",
-            "; Printer Specifications:",
-            f";   Reach radius: {self.config.reach_radius_m}m",
-            f";   Max height: {self.config.max_height_m}m",
-            f";   Nozzle diameter: {self.config.nozzle_diameter_mm}mm",
-            f";   Layer height: {self.config.default_layer_height_mm}mm",
-            f";   Print speed: {self.speed}mm/s",
-            "",
-            f"; Material: {material}",
-            "",
-            "; Startup sequence",
-            "G21 ; Set units to millimeters",
-            "G90 ; Absolute positioning",
-            "M82 ; Absolute extrusion (for paste extruders)",
-            "G28 ; Home all axes",
-            "G1 Z50 F3000 ; Move to safe height",
-            "M400 ; Wait for moves to complete",
-            "",
-            "; Material preparation (manual)",
-            "; 1. Load earth mix into hopper",
-            "; 2. Prime extruder until consistent flow",
-            "; 3. Verify nozzle clearance (paper test)",
-            "M0 Click to begin printing... ; Pause for operator",
-            ""
-        ]
-        return lines
+        return _HEADER_TEMPLATE.substitute(
+            name=self.config.name,
+            reach=self.config.reach_radius_m,
+            height=self.config.max_height_m,
+            nozzle=self.config.nozzle_diameter_mm,
+            layer=self.config.default_layer_height_mm,
+            speed=self.speed,
+            material=material
+        ).split("\n")
     
     def generate_footer(self) -> List[str]:
         """Generate G-code footer."""
-        return [
-            "",
-            "; Print complete",
-            "M400 ; Wait for moves to complete",
-            "G28 ; Home all axes",
-            "M0 Print complete - clean nozzle and power down ; Final pause",
-            "M84 ; Disable motors"
-        ]
+        return list(_FOOTER_LINES)
     
     def generate_circular_wall(self, diameter_m: float, height_m: float,
                                wall_thickness_m: float = 0.30,
@@ -133,7 +153,39 @@ class GenericSlicer:
         Generate G-code for circular wall using G2/G3 arcs.
         Compatible with all Marlin-based printers.
         """
-        lines = self.generate_header()
+        return "\n".join(self._iter_circular_wall(
+            diameter_m, height_m, wall_thickness_m, infill
+        ))
+    
+    def write_circular_wall(self, fd: int, diameter_m: float, height_m: float,
+                            wall_thickness_m: float = 0.30,
+                            infill: bool = True) -> int:
+        """
+        Stream circular wall G-code to an open file descriptor.
+        Memory use stays constant regardless of layer count, which matters
+        for tall prints (e.g. 8.4m on COBOD BOD2).
+        
+        Returns:
+            Number of bytes written
+        """
+        buf = bytearray()
+        written = 0
+        for line in self._iter_circular_wall(diameter_m, height_m,
+                                             wall_thickness_m, infill):
+            buf += line.encode()
+            buf += b"\n"
+            if len(buf) >= _WRITE_CHUNK_BYTES:
+                written += _write_all(fd, buf)
+                buf.clear()
+        if buf:
+            written += _write_all(fd, buf)
+        return written
+    
+    def _iter_circular_wall(self, diameter_m: float, height_m: float,
+                            wall_thickness_m: float,
+                            infill: bool) -> Iterator[str]:
+        """Yield circular wall G-code line by line."""
+        yield from self.generate_header()
         
         radius = diameter_m / 2
         inner_radius = radius - wall_thickness_m
@@ -141,13 +193,13 @@ class GenericSlicer:
         
         # Validate against printer limits
         if radius > self.config.reach_radius_m:
-            lines.append(f"; WARNING: Radius {radius}m exceeds printer reach {self.config.reach_radius_m}m")
+            yield f"; WARNING: Radius {radius}m exceeds printer reach {self.config.reach_radius_m}m"
         if height_m > self.config.max_height_m:
-            lines.append(f"; WARNING: Height {height_m}m exceeds printer limit {self.config.max_height_m}m")
+            yield f"; WARNING: Height {height_m}m exceeds printer limit {self.config.max_height_m}m"
         
-        lines.append(f"; Circular wall: D={diameter_m}m, H={height_m}m, T={wall_thickness_m}m")
-        lines.append(f"; Total layers: {layers}")
-        lines.append("")
+        yield f"; Circular wall: D={diameter_m}m, H={height_m}m, T={wall_thickness_m}m"
+        yield f"; Total layers: {layers}"
+        yield ""
         
         # Perimeter speeds
         outer_speed = min(30, self.speed)  # Slower for outer wall quality
@@ -155,28 +207,26 @@ class GenericSlicer:
         
         for layer in range(layers):
             z = (layer + 1) * self.layer_height
-            z_mm = z * 1000
             
-            lines.append(f"; --- Layer {layer + 1}/{layers} (Z={z:.3f}m) ---")
+            yield f"; --- Layer {layer + 1}/{layers} (Z={z:.3f}m) ---"
             
             # Outer wall - clockwise arc (G2)
-            lines.append(f"G1 X{radius:.3f} Y0 Z{z:.3f} F{outer_speed*60:.0f} ; Move to start")
-            lines.append(f"G2 X{radius:.3f} Y0 I{-radius:.3f} J0 E{layer*0.5:.2f} ; Outer wall CW")
+            yield f"G1 X{radius:.3f} Y0 Z{z:.3f} F{outer_speed*60:.0f} ; Move to start"
+            yield f"G2 X{radius:.3f} Y0 I{-radius:.3f} J0 E{layer*0.5:.2f} ; Outer wall CW"
             
             # Inner wall - counter-clockwise arc (G3)
-            lines.append(f"G1 X{inner_radius:.3f} Y0 Z{z:.3f} F{inner_speed*60:.0f}")
-            lines.append(f"G3 X{inner_radius:.3f} Y0 I{-inner_radius:.3f} J0 ; Inner wall CCW")
+            yield f"G1 X{inner_radius:.3f} Y0 Z{z:.3f} F{inner_speed*60:.0f}"
+            yield f"G3 X{inner_radius:.3f} Y0 I{-inner_radius:.3f} J0 ; Inner wall CCW"
             
             # Honeycomb infill every 3rd layer
             if infill and layer > 0 and layer % 3 == 0:
-                lines.extend(self._generate_honeycomb_layer(
+                yield from self._generate_honeycomb_layer(
                     inner_radius, radius, z
-                ))
+                )
             
-            lines.append("")
+            yield ""
         
-        lines.extend(self.generate_footer())
-        return "\n".join(lines)
+        yield from self.generate_footer()
     
     def _generate_honeycomb_layer(self, inner_r: float, outer_r: float, 
                                    z: float) -> List[str]:
@@ -192,15 +242,9 @@ class GenericSlicer:
             lines.append(f"; Hex ring {ring} at r={r:.3f}m")
             
             # Generate hexagon vertices
-            for i in range(7):  # 6 vertices + return to start
-                angle = i * math.pi / 3
-                x = r * math.cos(angle)
-                y = r * math.sin(angle)
-                
-                if i == 0:
-                    lines.append(f"G1 X{x:.3f} Y{y:.3f} Z{z:.3f}")
-                else:
-                    lines.append(f"G1 X{x:.3f} Y{y:.3f}")
+            lines.append(f"G1 X{r * _HEX_COS[0]:.3f} Y{r * _HEX_SIN[0]:.3f} Z{z:.3f}")
+            for i in range(1, 7):  # remaining vertices + return to start
+                lines.append(f"G1 X{r * _HEX_COS[i]:.3f} Y{r * _HEX_SIN[i]:.3f}")
             
             r += hex_size * 1.5  # Step to next ring
         
@@ -319,6 +363,15 @@ class GenericSlicer:
         return "\n".join(report)
 
 
+def _write_all(fd: int, data: bytearray) -> int:
+    """Write the whole buffer to fd, retrying on short writes."""
+    view = memoryview(data)
+    total = len(view)
+    while view:
+        view = view[os.write(fd, view):]
+    return total
+
+
 def get_printer_config(printer_type: str) -> PrinterConfig:
     """Get configuration for named printer type."""
     configs = {
@@ -5,6 +5,7 @@ Compatible with WASP Crane and other large-format earth printers.
 """
 
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
 
@@ -216,42 +217,51 @@ class MaterialDatabase:
         return cls.MIXES[mix_name]
 
 
+# Quality control procedures - fixed text shared by every call. Keys filled
+# in per call are listed as None so the merged dicts keep this key order.
+_MOISTURE_TEST_BASE = MappingProxyType({
+    'test': 'Moisture Content',
+    'target': None,
+    'method': 'Oven drying at 105°C for 24 hours',
+    'frequency': 'Every batch',
+    'tolerance': '±1.5%'
+})
+
+_COMPRESSION_TEST_BASE = MappingProxyType({
+    'test': 'Compression Strength',
+    'sample_size': '150mm cubes',
+    'cure_time': None,
+    'method': 'ASTM C109 or EN 196-1',
+    'frequency': '1 per 10m³ or daily',
+    'expected_range': '2-10 MPa (mix dependent)'
+})
+
+_EXTRUSION_CONSISTENCY = MappingProxyType({
+    'test': 'Extrusion Consistency',
+    'method': 'Visual flow rate check',
+    'criteria': 'Continuous flow, no gaps or surges',
+    'frequency': 'Every 30 minutes during printing',
+    'adjustment': 'Add water if too dry, add binder if too wet'
+})
+
+
 class QualityControl:
     """Quality control procedures for earth printing."""
     
     @staticmethod
     def moisture_test(target_percent: float) -> Dict:
         """Moisture content test procedure."""
-        return {
-            'test': 'Moisture Content',
-            'target': f"{target_percent}%",
-            'method': 'Oven drying at 105°C for 24 hours',
-            'frequency': 'Every batch',
-            'tolerance': '±1.5%'
-        }
+        return {**_MOISTURE_TEST_BASE, 'target': f"{target_percent}%"}
     
     @staticmethod
     def compression_test_sample(cure_days: int = 28) -> Dict:
         """Compression test procedure for sample cubes."""
-        return {
-            'test': 'Compression Strength',
-            'sample_size': '150mm cubes',
-            'cure_time': f"{cure_days} days",
-            'method': 'ASTM C109 or EN 196-1',
-            'frequency': '1 per 10m³ or daily',
-            'expected_range': '2-10 MPa (mix dependent)'
-        }
+        return {**_COMPRESSION_TEST_BASE, 'cure_time': f"{cure_days} days"}
     
     @staticmethod
     def extrusion_consistency() -> Dict:
-        """Extrusion consistency check."""
-        return {
-            'test': 'Extrusion Consistency',
-            'method': 'Visual flow rate check',
-            'criteria': 'Continuous flow, no gaps or surges',
-            'frequency': 'Every 30 minutes during printing',
-            'adjustment': 'Add water if too dry, add binder if too wet'
-        }
+        """Extrusion consistency check procedure."""
+        return dict(_EXTRUSION_CONSISTENCY)
 
 
 def generate_material_report(typology: str, volume_m3: float, 
@@ -0,0 +1,38 @@
+"""
+harmonic-balance/render_farm/_render_worker.py
+Blender background worker for parallel mesh generation.
+
+Run by generate_typology_meshes() as:
+    blender --background --python _render_worker.py -- '<job json>'
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add project root to path (Blender does not run from the repo root)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from render_farm.blender_bridge import RESULT_MARKER, generate_typology_mesh
+
+
+def main():
+    """Generate one typology from the JSON job passed after '--'."""
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    if not argv:
+        print("Usage: blender --background --python _render_worker.py -- '<job json>'")
+        sys.exit(2)
+    
+    job = json.loads(argv[0])
+    result = generate_typology_mesh(
+        job.pop('typology'),
+        export_path=job.pop('export_path', None),
+        **job
+    )
+    
+    # Blender writes its own log lines to stdout; tag ours for the parent
+    print(RESULT_MARKER + json.dumps(result, default=str), flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,20 +4,35 @@ Blender mesh generation for Harmonic Habitats.
 Converts typologies to 3D meshes for visualization and export.
 """
 
+import importlib
+import importlib.util
 import math
+import mmap
 import json
+import os
+import subprocess
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 
-# Blender Python API (bpy) - imported when running in Blender context
-try:
-    import bpy
-    import bmesh
-    import mathutils
-    BLENDER_AVAILABLE = True
-except ImportError:
-    BLENDER_AVAILABLE = False
+import numpy as np
+
+# Blender Python API (bpy) - only probed here; the modules themselves are
+# imported on first use so mock mode never pays the bpy import cost
+BLENDER_AVAILABLE = importlib.util.find_spec('bpy') is not None
+
+_LAZY_MODULES = ('bpy', 'bmesh', 'mathutils')
+
+
+def __getattr__(name: str):
+    """Import Blender modules lazily on attribute access (PEP 562)."""
+    if name in _LAZY_MODULES:
+        module = importlib.import_module(name)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Material definitions
@@ -44,6 +59,279 @@ MATERIALS = {
 }
 
 
+def _clean_scene():
+    """
+    Remove the current scene's objects without going through bpy.ops.
+    Objects that only belong to other scenes are left alone.
+    """
+    import bpy
+    
+    for obj in list(bpy.context.scene.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+
+
+# Geometry is built as structure-of-arrays: positions (N, 3) float32 and
+# triangle indices (M, 3) int32, converted to a Blender mesh only at the end
+
+# Unit cube corners, index = 4*x + 2*y + z, and its 12 outward triangles
+_UNIT_CUBE = np.array([(x, y, z) for x in (-0.5, 0.5)
+                       for y in (-0.5, 0.5) for z in (-0.5, 0.5)], dtype=np.float32)
+_CUBE_TRIANGLES = np.array([
+    (0, 1, 3), (0, 3, 2),  # -X
+    (4, 6, 7), (4, 7, 5),  # +X
+    (0, 4, 5), (0, 5, 1),  # -Y
+    (2, 3, 7), (2, 7, 6),  # +Y
+    (0, 2, 6), (0, 6, 4),  # -Z
+    (1, 5, 7), (1, 7, 3),  # +Z
+], dtype=np.int32)
+
+# Unit square in the XY plane, facing +Z
+_UNIT_PLANE = np.array([(-0.5, -0.5, 0), (0.5, -0.5, 0),
+                        (0.5, 0.5, 0), (-0.5, 0.5, 0)], dtype=np.float32)
+_PLANE_TRIANGLES = np.array([(0, 1, 2), (0, 2, 3)], dtype=np.int32)
+
+
+@lru_cache(maxsize=16)
+def _unit_ring(segments: int) -> np.ndarray:
+    """Cached (segments, 2) cos/sin table of a unit regular polygon (read-only)."""
+    t = 2 * np.pi * np.arange(segments) / segments
+    ring = np.column_stack([np.cos(t), np.sin(t)]).astype(np.float32)
+    ring.flags.writeable = False
+    return ring
+
+
+def _ring(radius: float, z: float, segments: int) -> np.ndarray:
+    """Vertices of a regular polygon (CCW from +X) at height z."""
+    ring = np.empty((segments, 3), dtype=np.float32)
+    ring[:, :2] = _unit_ring(segments) * radius
+    ring[:, 2] = z
+    return ring
+
+
+def _ring_band(lower: int, upper: int, segments: int) -> np.ndarray:
+    """Triangles joining two rings starting at vertex offsets lower/upper."""
+    i = np.arange(segments, dtype=np.int32)
+    j = (i + 1) % segments
+    return np.concatenate([
+        np.stack([lower + i, lower + j, upper + j], axis=1),
+        np.stack([lower + i, upper + j, upper + i], axis=1),
+    ])
+
+
+def _ring_fan(center: int, ring: int, segments: int, flip: bool = False) -> np.ndarray:
+    """Triangle fan closing a ring around a centre vertex (+Z facing unless flip)."""
+    i = np.arange(segments, dtype=np.int32)
+    j = (i + 1) % segments
+    c = np.full(segments, center, dtype=np.int32)
+    if flip:
+        return np.stack([c, ring + j, ring + i], axis=1)
+    return np.stack([c, ring + i, ring + j], axis=1)
+
+
+def _annulus_arrays(outer_radius: float, inner_radius: float, depth: float,
+                    segments: int = 64) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Closed hollow cylinder from z=0 to z=depth: outer and inner side
+    walls plus top and bottom annular caps.
+    """
+    n = segments
+    positions = np.concatenate([
+        _ring(outer_radius, 0.0, n),    # outer bottom: 0
+        _ring(outer_radius, depth, n),  # outer top:    n
+        _ring(inner_radius, 0.0, n),    # inner bottom: 2n
+        _ring(inner_radius, depth, n),  # inner top:    3n
+    ])
+    triangles = np.concatenate([
+        _ring_band(0, n, n),          # outer wall, facing out
+        _ring_band(3 * n, 2 * n, n),  # inner wall, facing the void
+        _ring_band(n, 3 * n, n),      # top cap
+        _ring_band(2 * n, 0, n),      # bottom cap
+    ])
+    return positions, triangles
+
+
+def _cylinder_arrays(radius: float, depth: float, segments: int = 32,
+                     z_center: float = 0.0) -> Tuple[np.ndarray, np.ndarray]:
+    """Solid capped cylinder centred at (0, 0, z_center)."""
+    n = segments
+    z0, z1 = z_center - depth / 2, z_center + depth / 2
+    positions = np.concatenate([
+        _ring(radius, z0, n),
+        _ring(radius, z1, n),
+        np.array([(0, 0, z0), (0, 0, z1)], dtype=np.float32),
+    ])
+    triangles = np.concatenate([
+        _ring_band(0, n, n),
+        _ring_fan(2 * n + 1, n, n),
+        _ring_fan(2 * n, 0, n, flip=True),
+    ])
+    return positions, triangles
+
+
+def _disc_arrays(radius: float, z: float,
+                 segments: int = 64) -> Tuple[np.ndarray, np.ndarray]:
+    """Filled upward-facing disc at height z."""
+    positions = np.concatenate([
+        _ring(radius, z, segments),
+        np.array([(0, 0, z)], dtype=np.float32),
+    ])
+    return positions, _ring_fan(segments, 0, segments)
+
+
+def _boxes_arrays(centers: np.ndarray, angles: np.ndarray,
+                  dimensions: Tuple[float, float, float]) -> Tuple[np.ndarray, np.ndarray]:
+    """Many identical boxes, each rotated about Z and translated, as one mesh."""
+    count = len(centers)
+    corners = _UNIT_CUBE * np.asarray(dimensions, dtype=np.float32)  # (8, 3)
+    cos, sin = np.cos(angles), np.sin(angles)
+    
+    positions = np.empty((count, 8, 3), dtype=np.float32)
+    positions[..., 0] = cos[:, None] * corners[:, 0] - sin[:, None] * corners[:, 1]
+    positions[..., 1] = sin[:, None] * corners[:, 0] + cos[:, None] * corners[:, 1]
+    positions[..., 2] = corners[:, 2]
+    positions += np.asarray(centers, dtype=np.float32)[:, None, :]
+    
+    offsets = (np.arange(count, dtype=np.int32) * 8)[:, None, None]
+    triangles = _CUBE_TRIANGLES[None, :, :] + offsets
+    return positions.reshape(-1, 3), triangles.reshape(-1, 3)
+
+
+def _spiral_positions(total_steps, stair_diameter, riser_height):
+    """Tread centres and angles for a spiral stair, 0.5 rad per step."""
+    steps = np.arange(total_steps)
+    angles = steps * 0.5
+    r = stair_diameter * 0.5
+    return r * np.cos(angles), r * np.sin(angles), steps * riser_height, angles
+
+
+def _commit_mesh(name: str, positions: np.ndarray, triangles: np.ndarray):
+    """Create an (unlinked) triangle mesh datablock from SoA arrays."""
+    import bpy
+    
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(positions))
+    mesh.vertices.foreach_set('co', np.ascontiguousarray(positions, dtype=np.float32).ravel())
+    mesh.loops.add(triangles.size)
+    mesh.loops.foreach_set('vertex_index', np.ascontiguousarray(triangles, dtype=np.int32).ravel())
+    mesh.polygons.add(len(triangles))
+    mesh.polygons.foreach_set('loop_start', np.arange(0, triangles.size, 3, dtype=np.int32))
+    if bpy.app.version < (4, 0, 0):
+        # Derived from loop_start (and read-only) from Blender 4.0
+        mesh.polygons.foreach_set('loop_total', np.full(len(triangles), 3, dtype=np.int32))
+    mesh.update()
+    return mesh
+
+
+def _link_object(name: str, data, location: Tuple[float, float, float] = (0, 0, 0),
+                 rotation: Tuple[float, float, float] = (0, 0, 0),
+                 scale: Tuple[float, float, float] = (1, 1, 1)):
+    """Create an object for existing datablock and link it to the scene."""
+    import bpy
+    
+    obj = bpy.data.objects.new(name, data)
+    obj.location = location
+    obj.rotation_euler = rotation
+    obj.scale = scale
+    bpy.context.collection.objects.link(obj)
+    return obj
+
+
+def _add_camera(location: Tuple[float, float, float],
+                rotation: Tuple[float, float, float]):
+    """Create a camera from datablocks and make it the scene camera."""
+    import bpy
+    
+    camera = _link_object('Camera', bpy.data.cameras.new('Camera'),
+                          location=location, rotation=rotation)
+    bpy.context.scene.camera = camera
+    return camera
+
+
+# Materials already built in this session, keyed by material name
+_MATERIAL_CACHE: Dict[str, object] = {}
+
+
+def _cached_material(name: str):
+    """Return an already-built material by name, or None if it must be built."""
+    import bpy
+    
+    mat = _MATERIAL_CACHE.get(name)
+    if mat is not None:
+        try:
+            mat.name  # Raises if the datablock was freed (e.g. file reload)
+            return mat
+        except ReferenceError:
+            del _MATERIAL_CACHE[name]
+    
+    mat = bpy.data.materials.get(name)
+    if mat is not None:
+        _MATERIAL_CACHE[name] = mat
+    return mat
+
+
+# Prebaked earth displacement noise (replaces a ShaderNodeTexNoise with
+# Scale 50 / Detail 8): tileable fractal value noise
+_NOISE_SIZE = 1024
+_NOISE_OCTAVES = 8
+_NOISE_BASE_CELLS = 8
+_NOISE_TILE_REPEAT = 50.0 / _NOISE_BASE_CELLS
+
+
+@lru_cache(maxsize=2)
+def _fractal_noise(size: int = _NOISE_SIZE, octaves: int = _NOISE_OCTAVES,
+                   base_cells: int = _NOISE_BASE_CELLS, seed: int = 0) -> np.ndarray:
+    """
+    Tileable fractal value noise in [0, 1], shape (size, size), float32.
+    Each octave doubles the lattice frequency and halves the amplitude.
+    """
+    rng = np.random.default_rng(seed)
+    noise = np.zeros((size, size), dtype=np.float32)
+    amplitude, total = 1.0, 0.0
+    
+    for octave in range(octaves):
+        cells = base_cells * 2 ** octave
+        if cells > size:
+            break
+        lattice = rng.random((cells, cells), dtype=np.float32)
+        
+        coords = np.arange(size, dtype=np.float32) * cells / size
+        i0 = coords.astype(np.int32)
+        i1 = (i0 + 1) % cells
+        t = coords - i0
+        t = t * t * (3 - 2 * t)  # Smoothstep between lattice points
+        
+        top = lattice[i0][:, i0] * (1 - t) + lattice[i0][:, i1] * t
+        bottom = lattice[i1][:, i0] * (1 - t) + lattice[i1][:, i1] * t
+        noise += amplitude * (top * (1 - t[:, None]) + bottom * t[:, None])
+        
+        total += amplitude
+        amplitude *= 0.5
+    
+    noise /= total
+    noise.flags.writeable = False
+    return noise
+
+
+def _earth_noise_image():
+    """Return the packed EarthNoise image, baking it on first use."""
+    import bpy
+    
+    image = bpy.data.images.get('EarthNoise')
+    if image is not None:
+        return image
+    
+    gray = _fractal_noise()
+    pixels = np.empty((_NOISE_SIZE, _NOISE_SIZE, 4), dtype=np.float32)
+    pixels[..., :3] = gray[..., None]
+    pixels[..., 3] = 1.0
+    
+    image = bpy.data.images.new('EarthNoise', _NOISE_SIZE, _NOISE_SIZE,
+                                alpha=True, float_buffer=True)
+    image.pixels.foreach_set(pixels.ravel())
+    image.pack()  # Keep the baked pixels inside saved .blend files
+    return image
+
+
 class BlenderMaterialSetup:
     """Setup materials for Harmonic Habitats."""
     
@@ -53,6 +341,12 @@ class BlenderMaterialSetup:
         if not BLENDER_AVAILABLE:
             return None
         
+        import bpy
+        
+        cached = _cached_material('RawEarth')
+        if cached is not None:
+            return cached
+        
         mat = bpy.data.materials.new(name='RawEarth')
         mat.use_nodes = True
         nodes = mat.node_tree.nodes
@@ -70,15 +364,23 @@ class BlenderMaterialSetup:
         bsdf.inputs['Roughness'].default_value = MATERIALS['raw_earth']['roughness']
         bsdf.inputs['Subsurface'].default_value = MATERIALS['raw_earth']['subsurface']
         
-        # Displacement noise for earth texture
-        noise = nodes.new('ShaderNodeTexNoise')
-        noise.inputs['Scale'].default_value = 50.0
-        noise.inputs['Detail'].default_value = 8.0
+        # Displacement from a prebaked noise image - a texture lookup per
+        # sample instead of evaluating 8 octaves of procedural noise
+        coords = nodes.new('ShaderNodeTexCoord')
+        mapping = nodes.new('ShaderNodeMapping')
+        mapping.inputs['Scale'].default_value = (_NOISE_TILE_REPEAT,) * 3
+        noise = nodes.new('ShaderNodeTexImage')
+        noise.image = _earth_noise_image()
+        noise.image.colorspace_settings.name = 'Non-Color'
+        noise.extension = 'REPEAT'
         
         # Link
+        links.new(coords.outputs['Generated'], mapping.inputs['Vector'])
+        links.new(mapping.outputs['Vector'], noise.inputs['Vector'])
         links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
-        links.new(noise.outputs['Fac'], output.inputs['Displacement'])
+        links.new(noise.outputs['Color'], output.inputs['Displacement'])
         
+        _MATERIAL_CACHE['RawEarth'] = mat
         return mat
     
     @staticmethod
@@ -87,6 +389,12 @@ class BlenderMaterialSetup:
         if not BLENDER_AVAILABLE:
             return None
         
+        import bpy
+        
+        cached = _cached_material('WoodInterior')
+        if cached is not None:
+            return cached
+        
         mat = bpy.data.materials.new(name='WoodInterior')
         mat.use_nodes = True
         nodes = mat.node_tree.nodes
@@ -98,6 +406,7 @@ class BlenderMaterialSetup:
         output = nodes.new('ShaderNodeOutputMaterial')
         mat.node_tree.links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
         
+        _MATERIAL_CACHE['WoodInterior'] = mat
         return mat
 
 
@@ -118,106 +427,84 @@ class SinglePodMesh:
             return self._generate_mock_data()
         
         # Clean scene
-        bpy.ops.object.select_all(action='SELECT')
-        bpy.ops.object.delete(use_global=False)
-        
-        # Create main cylinder (walls)
-        bpy.ops.mesh.primitive_cylinder_add(
-            radius=self.radius,
-            depth=self.height,
-            vertices=64,
-            location=(0, 0, self.height / 2)
-        )
-        walls = bpy.context.active_object
-        walls.name = "Pod_Walls"
-        
-        # Create inner cylinder (hollow)
-        bpy.ops.mesh.primitive_cylinder_add(
-            radius=self.radius - self.wall_thickness,
-            depth=self.height + 0.1,
-            vertices=64,
-            location=(0, 0, self.height / 2)
-        )
-        inner = bpy.context.active_object
-        inner.name = "Inner_Void"
-        
-        # Boolean difference to create hollow walls
-        mod = walls.modifiers.new(name="Boolean", type='BOOLEAN')
-        mod.operation = 'DIFFERENCE'
-        mod.object = inner
-        
-        # Apply boolean
-        bpy.context.view_layer.objects.active = walls
-        bpy.ops.object.modifier_apply(modifier="Boolean")
-        
-        # Delete inner void
-        bpy.data.objects.remove(inner)
-        
-        # Create service core (boolean cut)
-        bpy.ops.mesh.primitive_cylinder_add(
-            radius=self.core_diameter / 2,
-            depth=self.height,
-            vertices=32,
-            location=(0, 0, self.height / 2)
-        )
-        core = bpy.context.active_object
-        core.name = "Service_Core"
-        
-        # Boolean cut core from walls
-        mod = walls.modifiers.new(name="Boolean_Core", type='BOOLEAN')
-        mod.operation = 'DIFFERENCE'
-        mod.object = core
-        bpy.ops.object.modifier_apply(modifier="Boolean_Core")
-        bpy.data.objects.remove(core)
-        
-        # Create floor
-        bpy.ops.mesh.primitive_circle_add(
-            radius=self.radius - self.wall_thickness / 2,
-            vertices=64,
-            fill_type='NGON',
-            location=(0, 0, 0)
-        )
-        floor = bpy.context.active_object
-        floor.name = "Pod_Floor"
-        
-        # Extrude floor
-        bpy.ops.object.mode_set(mode='EDIT')
-        bpy.ops.mesh.extrude_region_move(TRANSFORM_OT_translate={"value":(0, 0, 0.2)})
-        bpy.ops.object.mode_set(mode='OBJECT')
-        
-        # Create roof
-        bpy.ops.mesh.primitive_circle_add(
-            radius=self.radius,
-            vertices=64,
-            fill_type='NGON',
-            location=(0, 0, self.height)
-        )
-        roof = bpy.context.active_object
-        roof.name = "Pod_Roof"
+        _clean_scene()
+        
+        objects = self.build_at((0, 0, 0))
         
         # Add honeycomb texture if requested
         if add_honeycomb:
-            self._add_honeycomb_surface(walls)
-        
-        # Assign materials
-        earth_mat = BlenderMaterialSetup.create_raw_earth_material()
-        if earth_mat:
-            for obj in [walls, floor, roof]:
-                if obj.data.materials:
-                    obj.data.materials[0] = earth_mat
-                else:
-                    obj.data.materials.append(earth_mat)
+            self._add_honeycomb_surface(objects[0])
         
         # Setup camera - 3/4 exterior view
         self._setup_camera_exterior()
         
         return {
             'typology': 'single_pod',
-            'objects': ['Pod_Walls', 'Pod_Floor', 'Pod_Roof'],
+            'objects': [obj.name for obj in objects],
             'materials': ['RawEarth'],
             'camera': '3/4_exterior'
         }
     
+    def build_at(self, location: Tuple[float, float, float],
+                 meshes: Dict[str, object] = None, prefix: str = "") -> List:
+        """
+        Add the pod's walls, floor and roof objects at a location without
+        touching the rest of the scene (no cleanup, camera or lights).
+        
+        Args:
+            location: World position of the pod base centre
+            meshes: Datablocks from build_meshes() to share; built if omitted
+            prefix: Prepended to each object name (e.g. "Pod_2_")
+        
+        Returns:
+            The new objects, walls first
+        """
+        meshes = meshes or self.build_meshes()
+        return [_link_object(f"{prefix}{name}", mesh, location)
+                for name, mesh in meshes.items()]
+    
+    def build_meshes(self) -> Dict[str, object]:
+        """
+        Build the pod's walls, floor and roof as mesh datablocks.
+        Nothing is linked to the scene, so the same datablocks can be
+        instanced by several objects (see MultiPodClusterMesh).
+        """
+        # Walls: hollow annulus built directly. The inner void and the
+        # service core are coaxial cylinders, so the former two boolean
+        # DIFFERENCE cuts reduce to a single inner radius - valid as long
+        # as the core sits entirely inside the void.
+        inner_radius = self.radius - self.wall_thickness
+        if inner_radius <= 0:
+            raise ValueError(
+                f"Wall thickness {self.wall_thickness}m leaves no interior "
+                f"in a {self.diameter}m pod"
+            )
+        if self.core_diameter / 2 >= inner_radius:
+            raise ValueError(
+                f"Service core diameter {self.core_diameter}m does not fit "
+                f"inside the {2 * inner_radius:.2f}m interior"
+            )
+        walls = _commit_mesh("Pod_Walls", *_annulus_arrays(
+            self.radius, inner_radius, self.height, 64
+        ))
+        
+        # Floor: 0.2m solid disc
+        floor = _commit_mesh("Pod_Floor", *_cylinder_arrays(
+            self.radius - self.wall_thickness / 2, 0.2, 64, z_center=0.1
+        ))
+        
+        # Roof: filled disc at wall height
+        roof = _commit_mesh("Pod_Roof", *_disc_arrays(self.radius, self.height, 64))
+        
+        # Assign materials
+        meshes = {'Pod_Walls': walls, 'Pod_Floor': floor, 'Pod_Roof': roof}
+        earth_mat = BlenderMaterialSetup.create_raw_earth_material()
+        if earth_mat:
+            for mesh in meshes.values():
+                mesh.materials.append(earth_mat)
+        
+        return meshes
+    
     def _add_honeycomb_surface(self, target_object):
         """Add honeycomb displacement to surface."""
         if not BLENDER_AVAILABLE:
@@ -234,20 +521,19 @@ class SinglePodMesh:
         if not BLENDER_AVAILABLE:
             return
         
+        import bpy
+        
         # Delete default camera
         if 'Camera' in bpy.data.objects:
             bpy.data.objects.remove(bpy.data.objects['Camera'])
         
         # Create new camera at 3/4 angle
-        bpy.ops.object.camera_add(location=(12, -12, 8))
-        camera = bpy.context.active_object
-        camera.rotation_euler = (math.radians(60), 0, math.radians(45))
-        bpy.context.scene.camera = camera
+        _add_camera((12, -12, 8), (math.radians(60), 0, math.radians(45)))
         
         # Add lighting
-        bpy.ops.object.light_add(type='SUN', location=(10, 10, 15))
-        sun = bpy.context.active_object
-        sun.data.energy = 5
+        sun_data = bpy.data.lights.new('Sun', 'SUN')
+        sun_data.energy = 5
+        _link_object('Sun', sun_data, location=(10, 10, 15))
     
     def _generate_mock_data(self) -> Dict:
         """Generate mock data when Blender not available."""
@@ -279,33 +565,24 @@ class MultiPodClusterMesh:
             return self._generate_mock_data()
         
         # Clean scene
-        bpy.ops.object.select_all(action='SELECT')
-        bpy.ops.object.delete(use_global=False)
+        _clean_scene()
+        
+        # All pods are identical: build the geometry once and let every
+        # pod object share the same mesh datablocks
+        pod = SinglePodMesh(
+            diameter=self.pod_diameter,
+            height=self.pod_height,
+            wall_thickness=0.30,
+            core_diameter=1.0
+        )
+        shared_meshes = pod.build_meshes()
         
         pod_meshes = []
+        xs, ys = self._ring_positions(self.arrangement_radius)
         
-        for i in range(self.pod_count):
-            angle = i * self.angle_step
-            x = self.arrangement_radius * math.cos(angle)
-            y = self.arrangement_radius * math.sin(angle)
-            
-            # Generate individual pod
-            pod = SinglePodMesh(
-                diameter=self.pod_diameter,
-                height=self.pod_height,
-                wall_thickness=0.30,
-                core_diameter=1.0
-            )
-            result = pod.generate(add_honeycomb=False)
-            
-            # Move pod to position
-            for obj_name in result['objects']:
-                if obj_name in bpy.data.objects:
-                    obj = bpy.data.objects[obj_name]
-                    obj.location = (x, y, 0)
-                    # Rename
-                    obj.name = f"Pod_{i+1}_{obj_name}"
-                    pod_meshes.append(obj.name)
+        for i, (x, y) in enumerate(zip(xs.tolist(), ys.tolist())):
+            objects = pod.build_at((x, y, 0), shared_meshes, prefix=f"Pod_{i+1}_")
+            pod_meshes.extend(obj.name for obj in objects)
         
         # Create connecting walkways
         if add_walkways:
@@ -324,63 +601,54 @@ class MultiPodClusterMesh:
             'connections': ['walkways', 'central_space']
         }
     
+    def _ring_positions(self, radius: float,
+                        angles: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray]:
+        """X/Y positions on a circle of given radius, one per pod (vectorized)."""
+        if angles is None:
+            angles = np.arange(self.pod_count) * self.angle_step
+        return radius * np.cos(angles), radius * np.sin(angles)
+    
     def _create_walkways(self):
         """Create curved walkways between pods."""
         if not BLENDER_AVAILABLE:
             return
         
-        for i in range(self.pod_count):
-            angle = i * self.angle_step + self.angle_step / 2
-            x = self.arrangement_radius * 0.7 * math.cos(angle)
-            y = self.arrangement_radius * 0.7 * math.sin(angle)
-            
-            # Create walkway segment
-            bpy.ops.mesh.primitive_plane_add(
-                size=1.5,
-                location=(x, y, 0.1)
-            )
-            walkway = bpy.context.active_object
-            walkway.name = f"Walkway_{i+1}"
-            walkway.scale = (3, 0.75, 1)
-            
-            # Rotate to face center
-            walkway.rotation_euler = (0, 0, angle)
+        angles = np.arange(self.pod_count) * self.angle_step + self.angle_step / 2
+        xs, ys = self._ring_positions(self.arrangement_radius * 0.7, angles)
+        
+        # One 1.5m plane shared by every walkway object
+        plane = _commit_mesh("Walkway", _UNIT_PLANE * 1.5, _PLANE_TRIANGLES)
+        
+        for i, (x, y, angle) in enumerate(zip(xs.tolist(), ys.tolist(), angles.tolist())):
+            # Walkway segment, rotated to face center
+            _link_object(f"Walkway_{i+1}", plane, location=(x, y, 0.1),
+                         rotation=(0, 0, angle), scale=(3, 0.75, 1))
     
     def _create_central_space(self):
         """Create central gathering space."""
         if not BLENDER_AVAILABLE:
             return
         
-        bpy.ops.mesh.primitive_cylinder_add(
-            radius=4.0,
-            depth=0.2,
-            vertices=32,
-            location=(0, 0, 0.1)
-        )
-        central = bpy.context.active_object
-        central.name = "Central_Gathering_Floor"
+        _link_object("Central_Gathering_Floor", _commit_mesh(
+            "Central_Gathering_Floor", *_cylinder_arrays(4.0, 0.2, 32, z_center=0.1)
+        ))
         
         # Add fire pit
-        bpy.ops.mesh.primitive_cylinder_add(
-            radius=0.8,
-            depth=0.4,
-            location=(0, 0, 0.2)
-        )
-        fire_pit = bpy.context.active_object
-        fire_pit.name = "Fire_Pit"
+        _link_object("Fire_Pit", _commit_mesh(
+            "Fire_Pit", *_cylinder_arrays(0.8, 0.4, 32, z_center=0.2)
+        ))
     
     def _setup_camera_cluster(self):
         """Setup aerial camera view for cluster."""
         if not BLENDER_AVAILABLE:
             return
         
+        import bpy
+        
         if 'Camera' in bpy.data.objects:
             bpy.data.objects.remove(bpy.data.objects['Camera'])
         
-        bpy.ops.object.camera_add(location=(0, 0, 25))
-        camera = bpy.context.active_object
-        camera.rotation_euler = (0, 0, 0)
-        bpy.context.scene.camera = camera
+        _add_camera((0, 0, 25), (0, 0, 0))
     
     def _generate_mock_data(self) -> Dict:
         """Generate mock data when Blender not available."""
@@ -392,6 +660,10 @@ class MultiPodClusterMesh:
         }
 
 
+# Tessellated flowing-form meshes keyed by (length, width, total_height)
+_FLOW_CACHE: Dict[Tuple[float, float, float], object] = {}
+
+
 class OrganicFamilyMesh:
     """Generate Blender mesh for OrganicFamily typology."""
     
@@ -409,8 +681,7 @@ class OrganicFamilyMesh:
             return self._generate_mock_data()
         
         # Clean scene
-        bpy.ops.object.select_all(action='SELECT')
-        bpy.ops.object.delete(use_global=False)
+        _clean_scene()
         
         # Create flowing base shape using curves
         self._create_flowing_form()
@@ -436,29 +707,51 @@ class OrganicFamilyMesh:
         if not BLENDER_AVAILABLE:
             return
         
+        import bpy
+        
+        # Reuse the tessellated mesh for dimensions already built
+        key = (self.length, self.width, self.total_height)
+        mesh = _FLOW_CACHE.get(key)
+        if mesh is not None:
+            try:
+                mesh.name  # Raises if the datablock was freed
+                _link_object('FlowingShape', mesh)
+                return
+            except ReferenceError:
+                del _FLOW_CACHE[key]
+        
         # Create base curve
         curve_data = bpy.data.curves.new('FlowingCurve', 'CURVE')
         curve_data.dimensions = '3D'
         
         spline = curve_data.splines.new('NURBS')
-        points = [
-            (-self.length/2, -self.width/2, 0),
-            (-self.length/4, self.width/2, 0),
-            (0, -self.width/3, 0),
-            (self.length/4, self.width/2, 0),
-            (self.length/2, -self.width/2, 0)
-        ]
+        # Homogeneous (x, y, z, w) control points, flattened for foreach_set
+        points = np.array([
+            (-self.length/2, -self.width/2, 0, 1),
+            (-self.length/4, self.width/2, 0, 1),
+            (0, -self.width/3, 0, 1),
+            (self.length/4, self.width/2, 0, 1),
+            (self.length/2, -self.width/2, 0, 1)
+        ], dtype=np.float32)
         
         spline.points.add(len(points) - 1)
-        for i, pt in enumerate(points):
-            spline.points[i].co = (*pt, 1)
-        
-        curve_obj = bpy.data.objects.new('FlowingShape', curve_data)
-        bpy.context.collection.objects.link(curve_obj)
+        spline.points.foreach_set('co', points.ravel())
         
         # Extrude to create volume
         curve_data.bevel_depth = self.width / 2
         curve_data.extrude = self.total_height / 2
+        
+        # Tessellate once into a plain mesh, then drop the curve so later
+        # depsgraph evaluations don't re-tessellate it
+        curve_obj = _link_object('FlowingCurve', curve_data)
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        mesh = bpy.data.meshes.new_from_object(curve_obj.evaluated_get(depsgraph))
+        mesh.name = 'FlowingShape'
+        bpy.data.objects.remove(curve_obj, do_unlink=True)
+        bpy.data.curves.remove(curve_data)
+        
+        _FLOW_CACHE[key] = mesh
+        _link_object('FlowingShape', mesh)
     
     def _create_spiral_staircase(self):
         """Create spiral staircase geometry."""
@@ -469,58 +762,45 @@ class OrganicFamilyMesh:
         riser_height = 0.18
         total_steps = int(self.total_height / riser_height)
         
-        for i in range(total_steps):
-            angle = i * 0.5  # 0.5 rad per step
-            z = i * riser_height
-            x = (stair_diameter / 2) * math.cos(angle)
-            y = (stair_diameter / 2) * math.sin(angle)
-            
-            bpy.ops.mesh.primitive_cube_add(
-                size=0.3,
-                location=(x, y, z)
-            )
-            step = bpy.context.active_object
-            step.name = f"Stair_Step_{i+1}"
-            step.scale = (1.5, 0.3, 0.05)
-            step.rotation_euler = (0, 0, angle)
+        # All treads go into one mesh - a single datablock instead of
+        # one operator call and object per step
+        xs, ys, zs, angles = _spiral_positions(total_steps, stair_diameter, riser_height)
+        centers = np.column_stack([xs, ys, zs])
+        # 0.3m cube scaled (1.5, 0.3, 0.05)
+        _link_object("Stair_Steps", _commit_mesh(
+            "Stair_Steps", *_boxes_arrays(centers, angles, (0.45, 0.09, 0.015))
+        ))
         
         # Central column
-        bpy.ops.mesh.primitive_cylinder_add(
-            radius=0.15,
-            depth=self.total_height,
-            location=(0, 0, self.total_height / 2)
-        )
-        column = bpy.context.active_object
-        column.name = "Stair_Column"
+        _link_object("Stair_Column", _commit_mesh(
+            "Stair_Column",
+            *_cylinder_arrays(0.15, self.total_height, 32, z_center=self.total_height / 2)
+        ))
     
     def _create_level_floors(self):
         """Create floor plates for each level."""
         if not BLENDER_AVAILABLE:
             return
         
+        plane = _commit_mesh("Level_Floor", _UNIT_PLANE, _PLANE_TRIANGLES)
+        
         for level in range(1, self.levels + 1):
             z = level * self.height_per_level
-            
-            bpy.ops.mesh.primitive_plane_add(
-                size=1,
-                location=(0, 0, z)
-            )
-            floor = bpy.context.active_object
-            floor.name = f"Level_{level}_Floor"
-            floor.scale = (self.length / 2, self.width / 2, 1)
+            _link_object(f"Level_{level}_Floor", plane, location=(0, 0, z),
+                         scale=(self.length / 2, self.width / 2, 1))
     
     def _setup_camera_section(self):
         """Setup cross-section interior camera view."""
         if not BLENDER_AVAILABLE:
             return
         
+        import bpy
+        
         if 'Camera' in bpy.data.objects:
             bpy.data.objects.remove(bpy.data.objects['Camera'])
         
-        bpy.ops.object.camera_add(location=(self.length / 2, 0, self.total_height / 2))
-        camera = bpy.context.active_object
-        camera.rotation_euler = (math.radians(90), 0, math.radians(90))
-        bpy.context.scene.camera = camera
+        _add_camera((self.length / 2, 0, self.total_height / 2),
+                    (math.radians(90), 0, math.radians(90)))
     
     def _generate_mock_data(self) -> Dict:
         """Generate mock data when Blender not available."""
@@ -533,6 +813,186 @@ class OrganicFamilyMesh:
         }
 
 
+# Binary STL facet record: normal, three vertices, attribute byte count
+_STL_RECORD = np.dtype([
+    ('normal', '<f4', (3,)),
+    ('vertices', '<f4', (9,)),
+    ('attr', '<u2'),
+])
+
+# Facets converted per pass when filling the memory-mapped STL
+_STL_CHUNK_TRIANGLES = 1 << 16
+
+
+def _iter_scene_meshes():
+    """
+    Yield the triangulated geometry of each mesh object in the scene.
+    
+    Yields:
+        (object name, material name or None, world positions (N, 3) float32,
+         world vertex normals (N, 3) float32, triangles (M, 3) int32)
+    """
+    import bpy
+    
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    
+    for obj in bpy.context.scene.objects:
+        if obj.type != 'MESH':
+            continue
+        obj_eval = obj.evaluated_get(depsgraph)
+        mesh = obj_eval.to_mesh()
+        mesh.calc_loop_triangles()
+        
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get('co', co)
+        vn = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get('normal', vn)
+        tris = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+        mesh.loop_triangles.foreach_get('vertices', tris)
+        material = mesh.materials[0].name if mesh.materials and mesh.materials[0] else None
+        obj_eval.to_mesh_clear()
+        
+        matrix = np.array(obj.matrix_world, dtype=np.float32)
+        rotation = matrix[:3, :3]
+        co = co.reshape(-1, 3) @ rotation.T + matrix[:3, 3]
+        vn = vn.reshape(-1, 3) @ np.linalg.inv(rotation)
+        lengths = np.linalg.norm(vn, axis=1, keepdims=True)
+        np.divide(vn, lengths, out=vn, where=lengths > 0)
+        
+        tris = _optimize_vertex_cache(tris, len(co))
+        yield obj.name, material, co, vn, tris.reshape(-1, 3)
+
+
+def _optimize_vertex_cache(indices: np.ndarray, vertex_count: int) -> np.ndarray:
+    """
+    Reorder a flat triangle index buffer for post-transform vertex cache
+    locality (meshoptimizer's Forsyth-style optimizer). Returns the input
+    unchanged when meshoptimizer is not installed.
+    """
+    if len(indices) == 0:
+        return indices
+    
+    # Imported here so importing this module stays cheap
+    try:
+        import meshoptimizer
+    except ImportError:
+        return indices
+    
+    optimized = np.empty(len(indices), dtype=np.uint32)
+    meshoptimizer.optimize_vertex_cache(
+        optimized, indices.astype(np.uint32), len(indices), vertex_count
+    )
+    return optimized.astype(np.int32)
+
+
+def _scene_triangles() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Triangulated geometry of every mesh object in the scene, in world space.
+    
+    Returns:
+        (positions (N, 3) float32, triangles (M, 3) int32)
+    """
+    positions, triangles = [], []
+    offset = 0
+    
+    for _, _, co, _, tris in _iter_scene_meshes():
+        positions.append(co)
+        triangles.append(tris + offset)
+        offset += len(co)
+    
+    if not positions:
+        return np.empty((0, 3), dtype=np.float32), np.empty((0, 3), dtype=np.int32)
+    return np.concatenate(positions), np.concatenate(triangles)
+
+
+def _write_obj(filepath: str, meshes) -> List[str]:
+    """
+    Write (name, material, positions, normals, triangles) groups as OBJ.
+    
+    Returns:
+        Names of the materials referenced by the file
+    """
+    mtl_path = Path(filepath).with_suffix('.mtl')
+    materials = []
+    offset = 1  # OBJ indices are 1-based
+    
+    with open(filepath, 'w') as f:
+        f.write("# Harmonic Habitats OBJ export\n")
+        f.write(f"mtllib {mtl_path.name}\n")
+        for name, material, positions, normals, triangles in meshes:
+            f.write(f"o {name}\n")
+            np.savetxt(f, positions, fmt='v %.6f %.6f %.6f')
+            np.savetxt(f, normals, fmt='vn %.6f %.6f %.6f')
+            if material:
+                f.write(f"usemtl {material}\n")
+                if material not in materials:
+                    materials.append(material)
+            # Vertex and normal indices coincide: f a//a b//b c//c
+            np.savetxt(f, np.repeat(triangles + offset, 2, axis=1),
+                       fmt='f %d//%d %d//%d %d//%d')
+            offset += len(positions)
+    
+    return materials
+
+
+def _write_mtl(filepath: str, material_names: List[str]):
+    """Write a minimal MTL file with base colour per material."""
+    import bpy
+    
+    lines = ["# Harmonic Habitats materials"]
+    for name in material_names:
+        color = (0.8, 0.8, 0.8)
+        mat = bpy.data.materials.get(name)
+        if mat is not None:
+            color = tuple(mat.diffuse_color)[:3]
+        lines.extend([
+            f"newmtl {name}",
+            f"Kd {color[0]:.6f} {color[1]:.6f} {color[2]:.6f}",
+            ""
+        ])
+    Path(filepath).write_text("\n".join(lines))
+
+
+def _write_binary_stl(filepath: str, positions: np.ndarray,
+                      triangles: np.ndarray):
+    """
+    Write triangles as binary STL with per-facet normals.
+    
+    The file is sized up front and memory-mapped; facet records are
+    filled in place chunk by chunk, so no full-size intermediate buffer
+    is ever built.
+    """
+    count = len(triangles)
+    size = 84 + count * _STL_RECORD.itemsize
+    
+    with open(filepath, 'w+b') as f:
+        f.truncate(size)
+        with mmap.mmap(f.fileno(), size) as mm:
+            mm[:80] = b"Harmonic Habitats binary STL".ljust(80, b" ")
+            mm[80:84] = np.uint32(count).tobytes()
+            records = np.frombuffer(mm, dtype=_STL_RECORD, count=count, offset=84)
+            _fill_stl_records(records, positions, triangles)
+            del records  # The map cannot close while a view is alive
+            mm.flush()
+
+
+def _fill_stl_records(records: np.ndarray, positions: np.ndarray,
+                      triangles: np.ndarray):
+    """Compute facet normals and corners into an STL record array."""
+    for start in range(0, len(triangles), _STL_CHUNK_TRIANGLES):
+        stop = start + _STL_CHUNK_TRIANGLES
+        corners = positions[triangles[start:stop]]  # (k, 3, 3)
+        normals = np.cross(corners[:, 1] - corners[:, 0],
+                           corners[:, 2] - corners[:, 0])
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+        np.divide(normals, lengths, out=normals, where=lengths > 0)
+        
+        chunk = records[start:stop]
+        chunk['normal'] = normals
+        chunk['vertices'] = corners.reshape(-1, 9)
+        chunk['attr'] = 0
+
+
 class BlenderExporter:
     """Export Blender scenes to various formats."""
     
@@ -540,6 +1000,7 @@ class BlenderExporter:
     def export_blend(filepath: str):
         """Save as .blend file."""
         if BLENDER_AVAILABLE:
+            import bpy
             bpy.ops.wm.save_as_mainfile(filepath=filepath)
         else:
             print(f"[MOCK] Would save .blend to {filepath}")
@@ -548,11 +1009,8 @@ class BlenderExporter:
     def export_obj(filepath: str):
         """Export to OBJ format."""
         if BLENDER_AVAILABLE:
-            bpy.ops.export_scene.obj(
-                filepath=filepath,
-                use_selection=False,
-                use_materials=True
-            )
+            materials = _write_obj(filepath, _iter_scene_meshes())
+            _write_mtl(str(Path(filepath).with_suffix('.mtl')), materials)
         else:
             print(f"[MOCK] Would export .obj to {filepath}")
     
@@ -560,17 +1018,8 @@ class BlenderExporter:
     def export_stl(filepath: str, for_wasp: bool = True):
         """Export to STL for WASP slicer."""
         if BLENDER_AVAILABLE:
-            # Select all mesh objects
-            bpy.ops.object.select_all(action='DESELECT')
-            for obj in bpy.data.objects:
-                if obj.type == 'MESH':
-                    obj.select_set(True)
-            
-            bpy.ops.export_mesh.stl(
-                filepath=filepath,
-                use_selection=True,
-                ascii=False
-            )
+            positions, triangles = _scene_triangles()
+            _write_binary_stl(filepath, positions, triangles)
         else:
             print(f"[MOCK] Would export .stl to {filepath} (for WASP: {for_wasp})")
     
@@ -638,6 +1087,73 @@ def generate_typology_mesh(typology: str, export_path: str = None, **params) ->
     return result
 
 
+# Prefix of the stdout line carrying a worker's JSON result
+RESULT_MARKER = "HARMONIC_RESULT:"
+
+_WORKER_SCRIPT = Path(__file__).parent / '_render_worker.py'
+
+
+def _run_blender_worker(job: Dict, blender_executable: str) -> Dict:
+    """Run one job in a separate background Blender process."""
+    completed = subprocess.run(
+        [blender_executable, '--background', '--factory-startup',
+         '--python', str(_WORKER_SCRIPT), '--', json.dumps(job, default=str)],
+        capture_output=True,
+        text=True
+    )
+    for line in completed.stdout.splitlines():
+        if line.startswith(RESULT_MARKER):
+            return json.loads(line[len(RESULT_MARKER):])
+    
+    return {
+        'typology': job.get('typology'),
+        'error': f"Blender worker exited with code {completed.returncode}",
+        'stderr': completed.stderr[-2000:]
+    }
+
+
+def generate_typology_meshes(jobs: List[Dict], export_path: str = None,
+                             parallel: bool = True, max_workers: int = None,
+                             blender_executable: str = 'blender') -> List[Dict]:
+    """
+    Generate several typologies, optionally one Blender process per job.
+    
+    bpy is single-threaded, so parallel mode launches background Blender
+    instances (each running _render_worker.py) and waits on them from a
+    thread pool; the Python side only blocks on subprocess I/O.
+    
+    Args:
+        jobs: Dicts with 'typology' plus typology-specific parameters
+        export_path: Base directory; each job exports to its own subfolder
+        parallel: Run jobs in separate Blender processes
+        max_workers: Concurrent Blender processes (default: CPU count)
+        blender_executable: Blender binary to launch
+    
+    Returns:
+        One result dict per job, in input order
+    """
+    prepared = []
+    for index, job in enumerate(jobs):
+        job = dict(job)
+        if export_path:
+            job['export_path'] = str(Path(export_path) / f"{index:03d}_{job['typology']}")
+        prepared.append(job)
+    
+    if not parallel:
+        return [
+            generate_typology_mesh(job.pop('typology'),
+                                   export_path=job.pop('export_path', None),
+                                   **job)
+            for job in prepared
+        ]
+    
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        return list(executor.map(
+            lambda job: _run_blender_worker(job, blender_executable),
+            prepared
+        ))
+
+
 if __name__ == "__main__":
     print("=== Blender Bridge Test (Mock Mode) ===")
     print(f"Blender available: {BLENDER_AVAILABLE}")
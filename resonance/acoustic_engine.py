@@ -9,8 +9,23 @@ from dataclasses import dataclass
 from typing import List, Tuple, Dict, Optional
 from enum import Enum
 
+import numpy as np
+
+from harmonic_compat import DATACLASS_SLOTS
+
 
 SCHUMANN_FREQUENCIES = [7.83, 14.3, 20.8, 27.3, 33.8, 39.0, 45.0]
+SCHUMANN_FREQS_ARR = np.asarray(SCHUMANN_FREQUENCIES, dtype=np.float64)
+
+# First 20 positive zeros j_{0,n} of the Bessel function J0
+# (scipy.special.jn_zeros(0, 20)), tabulated to avoid a runtime dependency
+BESSEL_J0_ZEROS = (
+    2.4048255576957724, 5.520078110286311, 8.653727912911013, 11.791534439014281,
+    14.930917708487787, 18.071063967910924, 21.21163662987926, 24.352471530749302,
+    27.493479132040253, 30.634606468431976, 33.77582021357357, 36.917098353664045,
+    40.05842576462824, 43.19979171317673, 46.341188371661815, 49.482609897397815,
+    52.624051841115, 55.76551075501998, 58.90698392608094, 62.048469190227166,
+)
 
 MALTA_ORACLE_ACOUSTICS = {
     'target_resonance_hz': 80.0,
@@ -19,7 +34,7 @@ MALTA_ORACLE_ACOUSTICS = {
 }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RoomMode:
     """A single room mode with frequency and type."""
     frequency_hz: float
@@ -28,7 +43,61 @@ class RoomMode:
     amplitude: float = 1.0
 
 
-@dataclass
+# Structure-of-arrays layout used for mode lists inside the analyzers;
+# RoomMode objects are only materialized at the public API boundary.
+_MODE_DTYPE = np.dtype([
+    ('freq', 'f8'), ('type', 'U16'),
+    ('n0', 'i2'), ('n1', 'i2'), ('n2', 'i2'),
+    ('amp', 'f8'),
+])
+
+
+def _modes_record(freqs: np.ndarray, mode_type: str, orders: Tuple,
+                  amplitude: float = 1.0) -> np.ndarray:
+    """Pack one mode family into a structured array.
+    
+    ``orders`` holds the three mode-number columns; scalars broadcast.
+    """
+    rec = np.empty(len(freqs), dtype=_MODE_DTYPE)
+    rec['freq'] = freqs
+    rec['type'] = mode_type
+    rec['n0'], rec['n1'], rec['n2'] = orders
+    rec['amp'] = amplitude
+    return rec
+
+
+def _sort_modes(rec: np.ndarray) -> np.ndarray:
+    """Sort a mode record by frequency, keeping family order on ties."""
+    return rec[np.argsort(rec['freq'], kind='stable')]
+
+
+def _j0_zeros(count: int) -> np.ndarray:
+    """First ``count`` zeros of J0; McMahon's expansion beyond the table."""
+    zeros = np.empty(count)
+    tabulated = min(count, len(BESSEL_J0_ZEROS))
+    zeros[:tabulated] = BESSEL_J0_ZEROS[:tabulated]
+    if count > tabulated:
+        beta = (np.arange(tabulated + 1, count + 1) - 0.25) * math.pi
+        zeros[tabulated:] = beta + 1 / (8 * beta) - 124 / (3 * (8 * beta) ** 3)
+    return zeros
+
+
+def _to_room_modes(rec: np.ndarray, digits: int = 2):
+    """
+    Yield RoomMode objects for each entry of a mode record.
+    
+    Records hold unrounded frequencies; they are rounded to ``digits``
+    here, in one batch, as modes leave the analyzers.
+    """
+    freqs = np.round(rec['freq'], digits).tolist()
+    orders = np.stack([rec['n0'], rec['n1'], rec['n2']], axis=1).tolist()
+    for freq, mode_type, order, amp in zip(freqs, rec['type'].tolist(),
+                                           orders, rec['amp'].tolist()):
+        yield RoomMode(frequency_hz=freq, mode_type=mode_type,
+                       order=tuple(order), amplitude=amp)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class AcousticProfile:
     """Complete acoustic profile for a space."""
     fundamental_hz: float
@@ -50,6 +119,10 @@ class CircularPodAcoustics:
     
     SPEED_OF_SOUND = 343.0  # m/s at 20°C
     
+    __slots__ = ('diameter', 'radius', 'height', 'wall_thickness', 'volume',
+                 'floor_area', 'surface_area', '_axial_k', '_radial_k',
+                 '_circ_k', '_mode_cache')
+    
     def __init__(self, diameter: float = 6.5, height: float = 3.2,
                  wall_thickness: float = 0.30):
         self.diameter = diameter
@@ -59,62 +132,72 @@ class CircularPodAcoustics:
         self.volume = math.pi * self.radius ** 2 * height
         self.floor_area = math.pi * self.radius ** 2
         self.surface_area = (2 * self.floor_area + math.pi * diameter * height)
+        # Per-order frequency steps; dimensions are fixed after construction
+        self._axial_k = self.SPEED_OF_SOUND / (2 * height)
+        self._radial_k = self.SPEED_OF_SOUND / (2 * math.pi * self.radius)
+        self._circ_k = self.SPEED_OF_SOUND / (math.pi * diameter)
+        self._mode_cache: Dict[int, np.ndarray] = {}
     
     def calculate_axial_modes(self, max_order: int = 5) -> List[RoomMode]:
-        """Calculate axial modes for circular cylinder."""
-        modes = []
-        
-        # Height modes (axial along cylinder axis)
-        for n in range(1, max_order + 1):
-            freq = n * self.SPEED_OF_SOUND / (2 * self.height)
-            modes.append(RoomMode(
-                frequency_hz=round(freq, 2),
-                mode_type='axial',
-                order=(0, 0, n)
-            ))
-        
-        # Radial modes (across diameter)
-        # First zero of J0 Bessel function ≈ 2.405
-        for n in range(1, max_order + 1):
-            freq = n * 2.405 * self.SPEED_OF_SOUND / (2 * math.pi * self.radius)
-            modes.append(RoomMode(
-                frequency_hz=round(freq, 2),
-                mode_type='radial',
-                order=(n, 0, 0)
-            ))
-        
-        # Circumferential modes
-        for n in range(1, max_order + 1):
-            freq = n * self.SPEED_OF_SOUND / (math.pi * self.diameter)
-            modes.append(RoomMode(
-                frequency_hz=round(freq, 2),
-                mode_type='tangential',
-                order=(0, n, 0)
-            ))
+        """Calculate axial modes for circular cylinder (memoized per max_order)."""
+        return list(_to_room_modes(self._mode_record(max_order)))
+    
+    def _mode_record(self, max_order: int) -> np.ndarray:
+        """Return the cached, frequency-sorted mode record for max_order."""
+        if max_order not in self._mode_cache:
+            self._mode_cache[max_order] = self._compute_axial_modes(max_order)
+        return self._mode_cache[max_order]
+    
+    def _compute_axial_modes(self, max_order: int) -> np.ndarray:
+        """Compute the sorted axial, radial and tangential modes."""
+        ns = np.arange(1, max_order + 1)
         
-        return sorted(modes, key=lambda m: m.frequency_hz)
+        return _sort_modes(np.concatenate([
+            # Height modes (axial along cylinder axis)
+            _modes_record(ns * self._axial_k,
+                          'axial', (0, 0, ns)),
+            # Radial modes (across diameter): n-th zero of J0
+            _modes_record(_j0_zeros(max_order) * self._radial_k,
+                          'radial', (ns, 0, 0)),
+            # Circumferential modes
+            _modes_record(ns * self._circ_k,
+                          'tangential', (0, ns, 0)),
+        ]))
     
     def find_schumann_coupling(self, tolerance_hz: float = 0.5) -> Dict:
         """Find how well room modes align with Schumann resonances."""
-        modes = self.calculate_axial_modes(max_order=10)
+        modes = self._mode_record(max_order=10)
+        mode_freqs = modes['freq']
+        # Modes are sorted by frequency, so each Schumann frequency only
+        # needs the slice of modes inside its tolerance window. The window
+        # is padded slightly and the exact delta test is applied within it.
+        margin = tolerance_hz + 1e-9
+        lo = np.searchsorted(mode_freqs, SCHUMANN_FREQS_ARR - margin, side='left')
+        hi = np.searchsorted(mode_freqs, SCHUMANN_FREQS_ARR + margin, side='right')
         couplings = []
         
-        for schumann_freq in SCHUMANN_FREQUENCIES:
-            for mode in modes:
-                delta = abs(mode.frequency_hz - schumann_freq)
+        for s_idx, (start, stop) in enumerate(zip(lo.tolist(), hi.tolist())):
+            schumann_freq = SCHUMANN_FREQUENCIES[s_idx]
+            for m_idx in range(start, stop):
+                delta = abs(float(mode_freqs[m_idx]) - schumann_freq)
                 if delta < tolerance_hz:
                     couplings.append({
                         'schumann_freq': schumann_freq,
-                        'room_mode': mode.frequency_hz,
+                        'room_mode': round(float(mode_freqs[m_idx]), 2),
                         'delta_hz': round(delta, 3),
-                        'mode_type': mode.mode_type,
+                        'mode_type': str(modes['type'][m_idx]),
                         'coupling_strength': round(1 - (delta / tolerance_hz), 3)
                     })
         
+        best_coupling = None
+        if couplings:
+            strengths = np.array([c['coupling_strength'] for c in couplings])
+            best_coupling = couplings[int(np.argmax(strengths))]
+        
         return {
             'couplings_found': len(couplings),
             'couplings': couplings,
-            'best_coupling': max(couplings, key=lambda x: x['coupling_strength']) if couplings else None
+            'best_coupling': best_coupling
         }
     
     def optimal_height_for_schumann(self, target_hz: float = 7.83) -> float:
@@ -153,6 +236,10 @@ class MultiPodClusterAcoustics:
     
     SPEED_OF_SOUND = 343.0
     
+    __slots__ = ('pod_diameter', 'arrangement_radius', 'central_space_diameter',
+                 'pod_count', 'central_radius', 'central_volume', 'central_area',
+                 '_central_axial_k', '_central_radial_k', '_central_modes')
+    
     def __init__(self, pod_diameter: float = 6.0, arrangement_radius: float = 12.0,
                  central_space_diameter: float = 8.0, pod_count: int = 4):
         self.pod_diameter = pod_diameter
@@ -162,31 +249,34 @@ class MultiPodClusterAcoustics:
         self.central_radius = central_space_diameter / 2
         self.central_volume = math.pi * self.central_radius ** 2 * 3.5
         self.central_area = math.pi * self.central_radius ** 2
+        # Central space is 3.5m high (open to sky/partial roof)
+        self._central_axial_k = self.SPEED_OF_SOUND / (2 * 3.5)
+        self._central_radial_k = self.SPEED_OF_SOUND / (2 * math.pi * self.central_radius)
+        self._central_modes: Optional[np.ndarray] = None
     
     def central_gathering_modes(self) -> List[RoomMode]:
-        """Calculate modes for central gathering space."""
-        modes = []
-        height = 3.5  # Open to sky/partial roof
-        
-        # Axial modes
-        for n in range(1, 6):
-            freq = n * self.SPEED_OF_SOUND / (2 * height)
-            modes.append(RoomMode(
-                frequency_hz=round(freq, 2),
-                mode_type='axial',
-                order=(0, 0, n)
-            ))
-        
-        # Radial modes of circular space
-        for n in range(1, 5):
-            freq = n * 2.405 * self.SPEED_OF_SOUND / (2 * math.pi * self.central_radius)
-            modes.append(RoomMode(
-                frequency_hz=round(freq, 2),
-                mode_type='radial',
-                order=(n, 0, 0)
-            ))
+        """Calculate modes for central gathering space (memoized)."""
+        return list(_to_room_modes(self._central_record()))
+    
+    def _central_record(self) -> np.ndarray:
+        """Return the cached, frequency-sorted central-space mode record."""
+        if self._central_modes is None:
+            self._central_modes = self._compute_central_modes()
+        return self._central_modes
+    
+    def _compute_central_modes(self) -> np.ndarray:
+        """Compute the sorted axial and radial modes of the central space."""
+        n_ax = np.arange(1, 6)
+        n_rad = np.arange(1, 5)
         
-        return sorted(modes, key=lambda m: m.frequency_hz)
+        return _sort_modes(np.concatenate([
+            # Axial modes
+            _modes_record(n_ax * self._central_axial_k,
+                          'axial', (0, 0, n_ax)),
+            # Radial modes of circular space
+            _modes_record(_j0_zeros(4) * self._central_radial_k,
+                          'radial', (n_rad, 0, 0)),
+        ]))
     
     def pod_to_pod_isolation(self, wall_transmission_loss_db: float = 45) -> Dict:
         """Calculate acoustic isolation between adjacent pods."""
@@ -209,12 +299,13 @@ class MultiPodClusterAcoustics:
     
     def cluster_resonance(self) -> Dict:
         """Calculate overall cluster resonance characteristics."""
-        central_modes = self.central_gathering_modes()
+        central = self._central_record()
+        central_modes = list(_to_room_modes(central))
         
         # Check for Schumann alignment in central space
-        schumann_aligned = any(
-            any(abs(m.frequency_hz - s) < 0.5 for s in SCHUMANN_FREQUENCIES)
-            for m in central_modes
+        mode_arr = central['freq']
+        schumann_aligned = bool(
+            (np.abs(mode_arr[:, None] - SCHUMANN_FREQS_ARR[None, :]) < 0.5).any()
         )
         
         return {
@@ -234,6 +325,9 @@ class OrganicFamilyAcoustics:
     
     SPEED_OF_SOUND = 343.0
     
+    __slots__ = ('length', 'width', 'height_per_level', 'levels', 'total_height',
+                 'floor_area', 'total_volume', '_vertical_k', '_length_k', '_width_k')
+    
     def __init__(self, length: float = 15.0, width: float = 5.6,
                  height_per_level: float = 2.8, levels: int = 2):
         self.length = length
@@ -243,6 +337,9 @@ class OrganicFamilyAcoustics:
         self.total_height = height_per_level * levels
         self.floor_area = length * width
         self.total_volume = self.floor_area * self.total_height
+        self._vertical_k = self.SPEED_OF_SOUND / (2 * height_per_level)
+        self._length_k = self.SPEED_OF_SOUND / (2 * length)
+        self._width_k = self.SPEED_OF_SOUND / (2 * width)
     
     def spiral_stair_waveguide(self, stair_diameter: float = 1.2,
                                riser_height: float = 0.18) -> Dict:
@@ -259,10 +356,9 @@ class OrganicFamilyAcoustics:
         cutoff_freq = self.SPEED_OF_SOUND / (2 * stair_diameter)
         
         # Helical resonances
-        resonances = []
-        for n in range(1, 6):
-            freq = n * self.SPEED_OF_SOUND / (2 * helix_length)
-            resonances.append(round(freq, 2))
+        c = self.SPEED_OF_SOUND
+        path = 2 * helix_length
+        resonances = [round(n * c / path, 2) for n in range(1, 6)]
         
         return {
             'helix_length_m': round(helix_length, 2),
@@ -276,42 +372,33 @@ class OrganicFamilyAcoustics:
     
     def multi_level_modes(self) -> Dict:
         """Calculate mode distribution across multiple levels."""
-        all_modes = []
+        n_ax = np.arange(1, 6)
+        n_lw = np.arange(1, 4)
         
-        for level in range(1, self.levels + 1):
-            level_height = level * self.height_per_level
-            level_volume = self.floor_area * self.height_per_level
-            
-            # Axial modes for this level's ceiling height
-            level_modes = []
-            for n in range(1, 6):
-                freq = n * self.SPEED_OF_SOUND / (2 * self.height_per_level)
-                level_modes.append(RoomMode(
-                    frequency_hz=round(freq, 2),
-                    mode_type='axial_vertical',
-                    order=(0, 0, n),
-                    amplitude=1.0 / level  # Attenuation with height
-                ))
-            
-            # Length and width modes
-            for n in range(1, 4):
-                freq_l = n * self.SPEED_OF_SOUND / (2 * self.length)
-                freq_w = n * self.SPEED_OF_SOUND / (2 * self.width)
-                level_modes.append(RoomMode(
-                    frequency_hz=round(freq_l, 2),
-                    mode_type='axial_length',
-                    order=(n, 0, 0)
-                ))
-                level_modes.append(RoomMode(
-                    frequency_hz=round(freq_w, 2),
-                    mode_type='axial_width',
-                    order=(0, n, 0)
-                ))
-            
+        # Length and width modes, interleaved per order
+        lengths = _modes_record(n_lw * self._length_k,
+                                'axial_length', (n_lw, 0, 0))
+        widths = _modes_record(n_lw * self._width_k,
+                               'axial_width', (0, n_lw, 0))
+        base = _sort_modes(np.concatenate([
+            # Axial modes for each level's ceiling height
+            _modes_record(n_ax * self._vertical_k,
+                          'axial_vertical', (0, 0, n_ax)),
+            np.stack([lengths, widths], axis=1).ravel(),
+        ]))
+        
+        # Modes are identical on every level; only the vertical amplitude
+        # attenuates with height.
+        vertical = base['type'] == 'axial_vertical'
+        amplitudes = 1.0 / np.arange(1, self.levels + 1)
+        all_modes = []
+        for level, amplitude in enumerate(amplitudes.tolist(), start=1):
+            level_rec = base.copy()
+            level_rec['amp'][vertical] = amplitude
             all_modes.append({
                 'level': level,
                 'ceiling_height': self.height_per_level,
-                'modes': sorted(level_modes, key=lambda m: m.frequency_hz)
+                'modes': list(_to_room_modes(level_rec))
             })
         
         return {
@@ -341,6 +428,20 @@ class OrganicFamilyAcoustics:
         }
 
 
+def _scan_modes(length, width, height, max_order):
+    """Flat (C-order) rectangular room mode frequencies for n in [0, max_order)."""
+    half_c = 343.0 / 2
+    # Squared per-axis terms are computed once per axis (max_order
+    # values each) and broadcast, rather than once per grid point.
+    # (n / L) ** 2 is kept instead of n * n / L ** 2 so rounded
+    # frequencies stay bit-for-bit identical.
+    n = np.arange(max_order, dtype=np.float64)
+    kx2 = ((n / length) ** 2)[:, None, None]
+    ky2 = ((n / width) ** 2)[None, :, None]
+    kz2 = ((n / height) ** 2)[None, None, :]
+    return (half_c * np.sqrt(kx2 + ky2 + kz2)).ravel()
+
+
 class MaltaOracleSimulator:
     """
     Simulate Malta oracle room acoustic characteristics.
@@ -373,40 +474,112 @@ class MaltaOracleSimulator:
         absorption = 0.161 * self.volume / (self.target_rt60 * surface_area)
         return absorption
     
-    def resonance_analysis(self) -> Dict:
-        """Analyze room to achieve 80Hz target resonance."""
-        c = 343.0
+    def resonance_analysis(self, max_order: int = 4) -> Dict:
+        """
+        Analyze room to achieve 80Hz target resonance.
+        
+        Scans mode numbers 0 <= nx, ny, nz < max_order.
+        """
+        if max_order < 2:
+            raise ValueError("max_order must be at least 2")
+        target = self.target_resonance
         
-        # Find mode closest to 80Hz
-        modes = []
-        for nx in range(4):
-            for ny in range(4):
-                for nz in range(4):
-                    if nx == 0 and ny == 0 and nz == 0:
-                        continue
-                    freq = c / 2 * math.sqrt((nx/self.length)**2 + 
-                                             (ny/self.width)**2 + 
-                                             (nz/self.height)**2)
-                    modes.append((freq, (nx, ny, nz)))
+        freqs = _scan_modes(self.length, self.width, self.height, max_order)
+        orders = np.indices((max_order,) * 3).reshape(3, -1).T
         
-        modes.sort()
+        # Drop (0, 0, 0)
+        freqs = freqs[1:]
+        orders = orders[1:]
         
-        # Find closest to 80Hz
-        closest = min(modes, key=lambda m: abs(m[0] - self.target_resonance))
+        # Find closest to 80Hz without sorting the full grid; equal deltas
+        # resolve to the lowest frequency, then the lowest order, as the
+        # previous sort-then-argmin did
+        deltas = np.abs(freqs - target)
+        ties = np.flatnonzero(deltas == deltas.min())
+        best = int(ties[np.argmin(freqs[ties])])
+        closest_freq = float(freqs[best])
+        
+        # Only the reported modes need sorting; stable sort keeps
+        # (freq, order) tuple ordering
+        below = np.flatnonzero(freqs < 150)
+        below = below[np.argsort(freqs[below], kind='stable')]
         
         return {
-            'target_resonance_hz': self.target_resonance,
+            'target_resonance_hz': target,
             'closest_mode': {
-                'frequency_hz': round(closest[0], 2),
-                'order': closest[1],
-                'delta_hz': round(abs(closest[0] - self.target_resonance), 2)
+                'frequency_hz': round(closest_freq, 2),
+                'order': tuple(orders[best].tolist()),
+                'delta_hz': round(float(deltas[best]), 2)
             },
             'target_rt60_sec': self.target_rt60,
             'required_absorption': round(self.target_absorption_for_rt60(), 3),
-            'all_modes_below_150hz': [(round(m[0], 1), m[1]) for m in modes if m[0] < 150]
+            'all_modes_below_150hz': [
+                (round(f, 1), tuple(o))
+                for f, o in zip(freqs[below].tolist(), orders[below].tolist())
+            ]
         }
 
 
+def _analyze_single_pod(**params) -> Dict:
+    analyzer = CircularPodAcoustics(
+        diameter=params.get('diameter', 6.5),
+        height=params.get('height', 3.2)
+    )
+    return {
+        'typology': 'single_pod',
+        'axial_modes': analyzer.calculate_axial_modes(),
+        'schumann_coupling': analyzer.find_schumann_coupling(),
+        'optimal_height_for_7.83hz': analyzer.optimal_height_for_schumann(),
+        'honeycomb_diffusion': analyzer.honeycomb_diffuser_effect()
+    }
+
+
+def _analyze_multi_pod_cluster(**params) -> Dict:
+    analyzer = MultiPodClusterAcoustics(
+        pod_diameter=params.get('pod_diameter', 6.0),
+        arrangement_radius=params.get('arrangement_radius', 12.0),
+        central_space_diameter=params.get('central_space_diameter', 8.0)
+    )
+    return {
+        'typology': 'multi_pod_cluster',
+        'central_gathering_modes': analyzer.central_gathering_modes(),
+        'pod_isolation': analyzer.pod_to_pod_isolation(),
+        'cluster_resonance': analyzer.cluster_resonance()
+    }
+
+
+def _analyze_organic_family(**params) -> Dict:
+    analyzer = OrganicFamilyAcoustics(
+        length=params.get('length', 15.0),
+        width=params.get('width', 5.6),
+        levels=params.get('levels', 2)
+    )
+    return {
+        'typology': 'organic_family',
+        'spiral_stair_waveguide': analyzer.spiral_stair_waveguide(),
+        'multi_level_modes': analyzer.multi_level_modes(),
+        'flowing_form_diffusion': analyzer.flowing_form_diffusion()
+    }
+
+
+def _analyze_malta_oracle(**params) -> Dict:
+    simulator = MaltaOracleSimulator(
+        room_dims=params.get('dims', (4.5, 3.2, 2.8))
+    )
+    return {
+        'typology': 'malta_oracle',
+        'resonance_analysis': simulator.resonance_analysis()
+    }
+
+
+_ANALYZERS = {
+    'single_pod': _analyze_single_pod,
+    'multi_pod_cluster': _analyze_multi_pod_cluster,
+    'organic_family': _analyze_organic_family,
+    'malta_oracle': _analyze_malta_oracle,
+}
+
+
 def full_acoustic_analysis(typology: str, **params) -> Dict:
     """
     Perform complete acoustic analysis for any typology.
@@ -418,56 +591,11 @@ def full_acoustic_analysis(typology: str, **params) -> Dict:
     Returns:
         Complete acoustic profile
     """
-    if typology == 'single_pod':
-        analyzer = CircularPodAcoustics(
-            diameter=params.get('diameter', 6.5),
-            height=params.get('height', 3.2)
-        )
-        return {
-            'typology': 'single_pod',
-            'axial_modes': analyzer.calculate_axial_modes(),
-            'schumann_coupling': analyzer.find_schumann_coupling(),
-            'optimal_height_for_7.83hz': analyzer.optimal_height_for_schumann(),
-            'honeycomb_diffusion': analyzer.honeycomb_diffuser_effect()
-        }
-    
-    elif typology == 'multi_pod_cluster':
-        analyzer = MultiPodClusterAcoustics(
-            pod_diameter=params.get('pod_diameter', 6.0),
-            arrangement_radius=params.get('arrangement_radius', 12.0),
-            central_space_diameter=params.get('central_space_diameter', 8.0)
-        )
-        return {
-            'typology': 'multi_pod_cluster',
-            'central_gathering_modes': analyzer.central_gathering_modes(),
-            'pod_isolation': analyzer.pod_to_pod_isolation(),
-            'cluster_resonance': analyzer.cluster_resonance()
-        }
-    
-    elif typology == 'organic_family':
-        analyzer = OrganicFamilyAcoustics(
-            length=params.get('length', 15.0),
-            width=params.get('width', 5.6),
-            levels=params.get('levels', 2)
-        )
-        return {
-            'typology': 'organic_family',
-            'spiral_stair_waveguide': analyzer.spiral_stair_waveguide(),
-            'multi_level_modes': analyzer.multi_level_modes(),
-            'flowing_form_diffusion': analyzer.flowing_form_diffusion()
-        }
-    
-    elif typology == 'malta_oracle':
-        simulator = MaltaOracleSimulator(
-            room_dims=params.get('dims', (4.5, 3.2, 2.8))
-        )
-        return {
-            'typology': 'malta_oracle',
-            'resonance_analysis': simulator.resonance_analysis()
-        }
-    
-    else:
-        raise ValueError(f"Unknown typology: {typology}")
+    try:
+        analyze = _ANALYZERS[typology]
+    except (KeyError, TypeError):
+        raise ValueError(f"Unknown typology: {typology}") from None
+    return analyze(**params)
 
 
 if __name__ == "__main__":
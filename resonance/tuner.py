@@ -7,6 +7,8 @@ import math
 from dataclasses import dataclass
 from typing import List, Tuple
 
+import numpy as np
+
 
 @dataclass
 class SchumannResonance:
@@ -14,12 +16,12 @@ class SchumannResonance:
     harmonics: Tuple[float, ...] = (14.3, 20.8, 27.3, 33.8, 39.0)
     
     def alignment_score(self, room_modes: List[float]) -> float:
-        all_freqs = (self.fundamental,) + self.harmonics
-        matches = sum(
-            1 for mode in room_modes 
-            if any(abs(mode - h) < 0.5 for h in all_freqs)
-        )
-        return matches / len(room_modes) if room_modes else 0.0
+        if not room_modes:
+            return 0.0
+        all_freqs = np.array((self.fundamental,) + self.harmonics)
+        modes = np.asarray(room_modes, dtype=np.float64)
+        nearest = np.min(np.abs(modes[:, None] - all_freqs[None, :]), axis=1)
+        return int(np.count_nonzero(nearest < 0.5)) / len(room_modes)
 
 
 class RoomModeCalculator:
@@ -1,9 +1,10 @@
-import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 # Create directories (already done, but safe to repeat)
 dirs = ['genesis', 'genesis/concepts', 'genesis/seeds', 'resonance', 'compliance', 'terracare', 'render_farm', 'api']
 for d in dirs:
-    os.makedirs(d, exist_ok=True)
+    Path(d).mkdir(parents=True, exist_ok=True)
 
 # File contents
 geometry_py = '''"""
@@ -18,6 +19,11 @@ import math
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
 
+import numpy as np
+
+
+SCHUMANN_HZ = np.array([7.83, 14.3, 20.8, 27.3, 33.8])
+
 
 @dataclass
 class ResonantCavity:
@@ -28,22 +34,16 @@ class ResonantCavity:
     shape_type: str = "hexagonal_prism"
     
     def calculate_modes(self, max_harmonic: int = 5) -> List[float]:
-        modes = []
-        for n in range(1, max_harmonic + 1):
-            mode = self.fundamental_hz * n * math.sqrt(
-                sum(1/d**2 for d in self.dimensions)
-            ) / math.sqrt(3)
-            modes.append(mode)
-        return modes
+        coeff = self.fundamental_hz * math.sqrt(
+            sum(1/d**2 for d in self.dimensions)
+        ) / math.sqrt(3)
+        return [coeff * n for n in range(1, max_harmonic + 1)]
     
     def schumann_alignment(self) -> bool:
-        schumann = [7.83, 14.3, 20.8, 27.3, 33.8]
         modes = self.calculate_modes()
         tolerance = 0.5
-        for s in schumann:
-            if any(abs(m - s) < tolerance for m in modes):
-                return True
-        return False
+        deltas = np.abs(np.array(modes)[:, None] - SCHUMANN_HZ[None, :])
+        return bool((deltas < tolerance).any())
 
 
 class HexagonalTessellation:
@@ -208,6 +208,8 @@ import math
 from dataclasses import dataclass
 from typing import List, Tuple
 
+import numpy as np
+
 
 @dataclass
 class SchumannResonance:
@@ -215,12 +217,12 @@ class SchumannResonance:
     harmonics: Tuple[float, ...] = (14.3, 20.8, 27.3, 33.8, 39.0)
     
     def alignment_score(self, room_modes: List[float]) -> float:
-        all_freqs = (self.fundamental,) + self.harmonics
-        matches = sum(
-            1 for mode in room_modes 
-            if any(abs(mode - h) < 0.5 for h in all_freqs)
-        )
-        return matches / len(room_modes) if room_modes else 0.0
+        if not room_modes:
+            return 0.0
+        all_freqs = np.array((self.fundamental,) + self.harmonics)
+        modes = np.asarray(room_modes, dtype=np.float64)
+        nearest = np.min(np.abs(modes[:, None] - all_freqs[None, :]), axis=1)
+        return int(np.count_nonzero(nearest < 0.5)) / len(room_modes)
 
 
 class RoomModeCalculator:
@@ -265,4 +267,30 @@ Computational temple architecture for the modern age.
 
 ```python
 from genesis.geometry import create_harmonic_habitat
-habitat = create_harmonic_habitat(footprint_area=150, target_frequency=7.83, levels=2)
\ No newline at end of file
+habitat = create_harmonic_habitat(footprint_area=150, target_frequency=7.83, levels=2)
+```
+'''
+
+files = {
+    'genesis/geometry.py': geometry_py,
+    'genesis/seeder.py': seeder_py,
+    'resonance/tuner.py': tuner_py,
+    'README.md': readme_md,
+}
+
+
+def write_file(path: str, content: str) -> bool:
+    """Write a template file unless it already exists."""
+    target = Path(path)
+    if target.exists():
+        return False
+    target.write_text(content, encoding='utf-8')
+    return True
+
+
+# Files are independent, so overlap the writes
+with ThreadPoolExecutor(max_workers=len(files)) as executor:
+    written = list(executor.map(write_file, files.keys(), files.values()))
+
+for path, created in zip(files, written):
+    print(f"{'Created' if created else 'Skipped (exists)'}: {path}")
@@ -6,15 +6,137 @@ Generates immutable design hashes and metadata for provenance tracking.
 
 import hashlib
 import json
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass, asdict
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timezone
-import uuid
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, List, Tuple
+from datetime import date
+import secrets
+from functools import lru_cache
 
+import numpy as np
 
-@dataclass
+from harmonic_compat import DATACLASS_SLOTS
+
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+
+# hashlib.sha256 is OpenSSL's implementation on standard CPython builds;
+# OpenSSL picks SHA-NI (x86) or the ARMv8 SHA2 extensions at runtime via
+# CPUID, falling back to portable code on CPUs without them.
+_sha256 = hashlib.sha256
+
+
+def fast_sha256(data: bytes) -> bytes:
+    """Raw 32-byte SHA-256 digest using the hardware-accelerated backend."""
+    return _sha256(data).digest()
+
+
+# Digest constructors by name. SHA-256 is the default and the only one
+# compatible with existing anchors; BLAKE3 is opt-in for stores that never
+# need to match SHA-256 hashes (a store must be reopened with the same one).
+_HASH_ALGOS = {'sha256': _sha256}
+if BLAKE3_AVAILABLE:
+    _HASH_ALGOS['blake3'] = blake3.blake3
+
+
+def _check_hash_algo(hash_algo: str) -> str:
+    """Validate a hash algorithm name, returning it unchanged."""
+    if hash_algo not in _HASH_ALGOS:
+        if hash_algo == 'blake3':
+            raise ValueError("hash_algo 'blake3' requires the blake3 package")
+        raise ValueError(f"Unknown hash_algo: {hash_algo}")
+    return hash_algo
+
+
+def _digest(blob: bytes, hash_algo: str = 'sha256') -> bytes:
+    """Raw digest of blob with the named algorithm."""
+    if hash_algo == 'sha256':
+        return fast_sha256(blob)
+    return _HASH_ALGOS[_check_hash_algo(hash_algo)](blob).digest()
+
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_utc_day = (None, '')  # (days since epoch, 'YYYY-MM-DD') of the last call
+
+
+def fast_utc_isoformat(ns: Optional[int] = None) -> str:
+    """
+    Current UTC time formatted like datetime.now(timezone.utc).isoformat().
+    The date part is only recomputed when the day rolls over.
+    """
+    global _utc_day
+    if ns is None:
+        ns = time.time_ns()
+    seconds, micros = divmod(ns // 1000, 1_000_000)
+    day, second_of_day = divmod(seconds, 86400)
+    if _utc_day[0] != day:
+        _utc_day = (day, date.fromordinal(_EPOCH_ORDINAL + day).isoformat())
+    hours, rem = divmod(second_of_day, 3600)
+    minutes, secs = divmod(rem, 60)
+    if micros:
+        return f"{_utc_day[1]}T{hours:02d}:{minutes:02d}:{secs:02d}.{micros:06d}+00:00"
+    return f"{_utc_day[1]}T{hours:02d}:{minutes:02d}:{secs:02d}+00:00"
+
+
+# Shared canonical encoder for hashing only. json.dumps() with non-default
+# options builds a new JSONEncoder on every call; anchored hashes depend on
+# this exact output (ASCII-escaped, sorted, compact), so it must not change.
+# Arrays become digest stubs, so it must never be used to store data.
+def _hash_default(obj):
+    """
+    Encode NumPy values for hashing. Arrays are packed to little-endian
+    int64/float64 and replaced by a digest of those bytes instead of being
+    walked element by element; scalars become plain Python numbers.
+    """
+    if isinstance(obj, np.ndarray):
+        kind = obj.dtype.kind
+        if kind in 'biu':
+            dtype = '<i8'
+        elif kind == 'f':
+            dtype = '<f8'
+        else:
+            raise TypeError(f"Cannot hash array of dtype {obj.dtype}")
+        packed = np.ascontiguousarray(obj, dtype=dtype).tobytes()
+        return {
+            '__ndarray__': dtype,
+            'shape': list(obj.shape),
+            'sha256': fast_sha256(packed).hex()
+        }
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+_HASH_JSON = json.JSONEncoder(sort_keys=True, separators=(',', ':'),
+                              default=_hash_default)
+
+
+def _storage_default(obj):
+    """Encode NumPy values losslessly for storage: arrays as nested lists."""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Same compact, key-sorted layout as the hashing encoder, but lossless
+_STORAGE_JSON = json.JSONEncoder(sort_keys=True, separators=(',', ':'),
+                                 default=_storage_default)
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class DesignAnchor:
     """
     Immutable anchor for a Harmonic Habitat design.
@@ -45,9 +167,16 @@ class DesignAnchor:
     # Creator (placeholder for wallet integration)
     creator_address: Optional[str] = None
     
-    def to_dict(self) -> Dict:
-        """Convert to dictionary for serialization."""
-        return {
+    # Lineage root-first, ending with this anchor (empty for legacy anchors)
+    ancestors: Tuple[str, ...] = ()
+    
+    # Serialized form, built once; anchors are immutable
+    _dict: Dict[str, Any] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # JSON round-trips the ancestor chain as a list
+        object.__setattr__(self, 'ancestors', tuple(self.ancestors))
+        object.__setattr__(self, '_dict', {
             'anchor_id': self.anchor_id,
             'design_hash': self.design_hash,
             'parent_anchor': self.parent_anchor,
@@ -60,45 +189,102 @@ class DesignAnchor:
             'timestamp': self.timestamp,
             'version': self.version,
             'iteration': self.iteration,
-            'creator_address': self.creator_address
-        }
+            'creator_address': self.creator_address,
+            'ancestors': list(self.ancestors)
+        })
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for serialization."""
+        return dict(self._dict)
+    
+    def to_canonical_bytes(self) -> bytes:
+        """Compact, key-sorted UTF-8 JSON used for storage."""
+        return _STORAGE_JSON.encode(self._dict).encode('utf-8')
+    
+    def to_pretty_json(self, indent: int = 2) -> str:
+        """Indented JSON for display."""
+        return json.dumps(self._dict, indent=indent, sort_keys=True,
+                          default=_storage_default)
     
     def to_json(self, indent: int = 2) -> str:
         """Serialize to JSON string."""
-        return json.dumps(self.to_dict(), indent=indent, sort_keys=True)
+        return self.to_pretty_json(indent)
 
 
 class DesignHasher:
-    """Generate cryptographic hashes of design data."""
+    """
+    Generate cryptographic hashes of design data.
+    
+    Every hash method takes hash_algo ('sha256' by default, or 'blake3'
+    when the blake3 package is installed). BLAKE3 hashes are not
+    interchangeable with SHA-256 ones and are not ledger-compatible.
+    """
+    
+    @staticmethod
+    def _normalize(data: Dict) -> bytes:
+        """Canonical (sorted, compact) JSON encoding used for hashing."""
+        return _HASH_JSON.encode(data).encode('utf-8')
+    
+    @staticmethod
+    def hash_batch(blobs: List[bytes], hash_algo: str = 'sha256') -> List[bytes]:
+        """
+        Hash several independent buffers in one call.
+        Returns raw 32-byte digests in input order.
+        """
+        if hash_algo == 'sha256':
+            return list(map(fast_sha256, blobs))
+        return [_digest(blob, hash_algo) for blob in blobs]
     
     @staticmethod
-    def hash_geometry(geometry_data: Dict) -> str:
+    def hash_geometry(geometry_data: Dict, hash_algo: str = 'sha256') -> str:
         """
-        Generate SHA-256 hash of geometry data.
+        Generate hash of geometry data (SHA-256 by default).
         Creates deterministic hash for geometry verification.
         """
         # Normalize geometry data for consistent hashing
-        normalized = json.dumps(geometry_data, sort_keys=True, separators=(',', ':'))
-        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+        return _digest(DesignHasher._normalize(geometry_data), hash_algo).hex()
     
     @staticmethod
-    def hash_parameters(parameters: Dict) -> str:
+    def hash_parameters(parameters: Dict, hash_algo: str = 'sha256') -> str:
         """Generate hash of design parameters."""
-        normalized = json.dumps(parameters, sort_keys=True, separators=(',', ':'))
-        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+        return _digest(DesignHasher._normalize(parameters), hash_algo).hex()
     
     @staticmethod
     def generate_design_hash(typology: str, parameters: Dict, 
-                            geometry_data: Dict) -> str:
+                            geometry_data: Dict, hash_algo: str = 'sha256') -> str:
         """
         Generate composite design hash.
         Combines typology, parameters, and geometry.
         """
-        param_hash = DesignHasher.hash_parameters(parameters)
-        geom_hash = DesignHasher.hash_geometry(geometry_data)
+        # Parameter and geometry digests are independent; only the
+        # composite depends on both
+        param_digest, geom_digest = DesignHasher.hash_batch([
+            DesignHasher._normalize(parameters),
+            DesignHasher._normalize(geometry_data),
+        ], hash_algo)
         
-        composite = f"{typology}:{param_hash}:{geom_hash}"
-        return hashlib.sha256(composite.encode('utf-8')).hexdigest()
+        return DesignHasher.composite_hash(typology, param_digest.hex(), geom_digest.hex(),
+                                           hash_algo)
+    
+    @staticmethod
+    def composite_hash(typology: str, param_hash: str, geom_hash: str,
+                       hash_algo: str = 'sha256') -> str:
+        """Combine precomputed parameter and geometry hashes into a design hash."""
+        prefix = _TYPOLOGY_PREFIX.get(typology)
+        if prefix is None:
+            prefix = f"{typology}:".encode('utf-8')
+        # Both hashes are hex digests, so ASCII encoding matches UTF-8
+        composite = prefix + f"{param_hash}:{geom_hash}".encode('ascii')
+        if hash_algo == 'sha256':
+            return fast_sha256(composite).hex()
+        return _digest(composite, hash_algo).hex()
+
+
+# Composite-hash prefixes for the built-in typologies
+_TYPOLOGY_PREFIX = {
+    typology: f"{typology}:".encode('utf-8')
+    for typology in ('single_pod', 'multi_pod_cluster', 'organic_family')
+}
 
 
 class AnchorRegistry:
@@ -107,25 +293,139 @@ class AnchorRegistry:
     Manages design iterations and prepares for blockchain submission.
     """
     
-    def __init__(self, storage_path: Path = None):
+    LOG_FILE = "anchors.log"
+    INDEX_FILE = "index.jsonl"
+    FSYNC_EVERY = 32  # Saves between fsyncs of the anchor log
+    
+    def __init__(self, storage_path: Path = None, hash_algo: str = 'sha256'):
         self.storage_path = storage_path or Path("terracare/anchors")
+        self.hash_algo = _check_hash_algo(hash_algo)
         self.storage_path.mkdir(parents=True, exist_ok=True)
+        # Anchors are loaded on demand. _index maps anchor_id ->
+        # (typology, timestamp, log offset, record length) and is built on
+        # first lookup; offset is None for legacy per-file anchors.
         self._anchors: Dict[str, DesignAnchor] = {}
-        self._load_existing()
-    
-    def _load_existing(self):
-        """Load existing anchors from storage."""
-        if not self.storage_path.exists():
-            return
+        self._index: Optional[Dict[str, Tuple[str, str, Optional[int], int]]] = None
+        # Column view of the index (ids, typologies, timestamps) for
+        # list_anchors; the index only grows, so its length tags staleness
+        self._columns: Optional[Tuple[List[str], np.ndarray, np.ndarray]] = None
+        self._unsynced = 0
+    
+    def _load_one(self, anchor_id: str) -> Optional[DesignAnchor]:
+        """Load a single anchor from storage into the cache."""
+        entry = self._load_index().get(anchor_id)
+        if entry is None:
+            return None
         
-        for anchor_file in self.storage_path.glob("*.json"):
-            try:
-                with open(anchor_file, 'r') as f:
+        _, _, offset, length = entry
+        try:
+            if offset is None:
+                with open(self.storage_path / f"{anchor_id}.json", 'r') as f:
                     data = json.load(f)
-                    anchor = DesignAnchor(**data)
-                    self._anchors[anchor.anchor_id] = anchor
-            except Exception as e:
-                print(f"Warning: Could not load anchor {anchor_file}: {e}")
+            else:
+                with open(self.storage_path / self.LOG_FILE, 'rb') as f:
+                    f.seek(offset)
+                    record = f.read(length)
+                try:
+                    data = json.loads(record)
+                except ValueError:
+                    data = None
+                # A stale offset (a save that raced another process without
+                # file locking) points into another record
+                if not isinstance(data, dict) or data.get('anchor_id') != anchor_id:
+                    data = self._scan_log(anchor_id)
+                    if data is None:
+                        raise ValueError("record not found in anchor log")
+            anchor = DesignAnchor(**data)
+        except Exception as e:
+            print(f"Warning: Could not load anchor {anchor_id}: {e}")
+            return None
+        
+        self._anchors[anchor_id] = anchor
+        return anchor
+    
+    def _scan_log(self, anchor_id: str) -> Optional[Dict]:
+        """Find an anchor's record by reading the whole anchor log."""
+        # Records are canonical (compact) JSON, so the ID appears verbatim
+        needle = f'"anchor_id":"{anchor_id}"'.encode('utf-8')
+        with open(self.storage_path / self.LOG_FILE, 'rb') as f:
+            for line in f:
+                if needle in line:
+                    return json.loads(line)
+        return None
+    
+    def _load_index(self) -> Dict[str, Tuple[str, str, Optional[int], int]]:
+        """Build the anchor index from index.jsonl on first use."""
+        if self._index is not None:
+            return self._index
+        
+        index = {}
+        indexed_end = 0
+        index_file = self.storage_path / self.INDEX_FILE
+        if index_file.exists():
+            with open(index_file, 'r') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        offset = entry.get('offset')
+                        length = entry.get('length', 0)
+                        index[entry['anchor_id']] = (entry['typology'], entry['timestamp'], offset, length)
+                    except (ValueError, KeyError):
+                        continue
+                    if offset is not None:
+                        indexed_end = max(indexed_end, offset + length + 1)
+        
+        # Log records written after the last index entry (an interrupted
+        # save) are recovered from the log itself
+        log_file = self.storage_path / self.LOG_FILE
+        if log_file.exists() and log_file.stat().st_size > indexed_end:
+            with open(log_file, 'rb') as f:
+                f.seek(indexed_end)
+                offset = indexed_end
+                for line in f:
+                    if line.endswith(b'\n'):
+                        try:
+                            anchor = DesignAnchor(**json.loads(line))
+                        except Exception:
+                            anchor = None
+                        if anchor and anchor.anchor_id not in index:
+                            index[anchor.anchor_id] = (anchor.typology, anchor.timestamp,
+                                                       offset, len(line) - 1)
+                            self._append_index(anchor, offset, len(line) - 1)
+                    offset += len(line)
+        
+        # Per-file anchors from before the log existed
+        with os.scandir(self.storage_path) as entries:
+            for entry in entries:
+                anchor_id, ext = os.path.splitext(entry.name)
+                if ext != '.json' or anchor_id in index:
+                    continue
+                try:
+                    with open(entry.path, 'r') as f:
+                        anchor = DesignAnchor(**json.load(f))
+                except Exception as e:
+                    print(f"Warning: Could not load anchor {entry.path}: {e}")
+                    continue
+                self._anchors[anchor_id] = anchor
+                index[anchor_id] = (anchor.typology, anchor.timestamp, None, 0)
+                self._append_index(anchor)
+        
+        self._index = index
+        return index
+    
+    def _append_index(self, anchor: DesignAnchor, offset: Optional[int] = None,
+                      length: int = 0):
+        """Record an anchor's listing metadata and log location in index.jsonl."""
+        entry = {
+            'anchor_id': anchor.anchor_id,
+            'typology': anchor.typology,
+            'timestamp': anchor.timestamp
+        }
+        if offset is not None:
+            entry['offset'] = offset
+            entry['length'] = length
+        with open(self.storage_path / self.INDEX_FILE, 'a') as f:
+            f.write(json.dumps(entry) + '\n')
     
     def create_anchor(self, typology: str, parameters: Dict,
                      geometry_data: Dict, compliance_status: Dict,
@@ -147,17 +447,32 @@ class AnchorRegistry:
         Returns:
             New DesignAnchor instance
         """
-        # Generate IDs and hashes
-        anchor_id = str(uuid.uuid4())
-        geometry_hash = DesignHasher.hash_geometry(geometry_data)
-        design_hash = DesignHasher.generate_design_hash(
-            typology, parameters, geometry_data
+        return self._create_hashed_anchor(
+            typology, parameters,
+            DesignHasher.hash_parameters(parameters, self.hash_algo),
+            DesignHasher.hash_geometry(geometry_data, self.hash_algo),
+            compliance_status, target_frequency, parent_anchor, creator_address
         )
+    
+    def _create_hashed_anchor(self, typology: str, parameters: Dict,
+                              param_hash: str, geometry_hash: str,
+                              compliance_status: Dict, target_frequency: float,
+                              parent_anchor: Optional[str],
+                              creator_address: Optional[str]) -> DesignAnchor:
+        """create_anchor with the parameter and geometry hashes already computed."""
+        # Generate IDs and hashes. The ID is random rather than derived
+        # from design_hash: re-anchoring an identical design is a new anchor.
+        anchor_id = secrets.token_hex(16)
+        design_hash = DesignHasher.composite_hash(typology, param_hash, geometry_hash,
+                                                  self.hash_algo)
         
         # Calculate iteration number
         iteration = 1
-        if parent_anchor and parent_anchor in self._anchors:
-            iteration = self._anchors[parent_anchor].iteration + 1
+        ancestors = (anchor_id,)
+        parent = self.get_anchor(parent_anchor) if parent_anchor else None
+        if parent:
+            iteration = parent.iteration + 1
+            ancestors = self._ancestor_ids(parent) + ancestors
         
         # Check Schumann alignment
         schumann_aligned = compliance_status.get('schumann_aligned', False)
@@ -173,10 +488,11 @@ class AnchorRegistry:
             target_frequency=target_frequency,
             schumann_aligned=schumann_aligned,
             compliance_status=compliance_status,
-            timestamp=datetime.now(timezone.utc).isoformat(),
+            timestamp=fast_utc_isoformat(),
             version=f"1.0.{iteration}",
             iteration=iteration,
-            creator_address=creator_address
+            creator_address=creator_address,
+            ancestors=ancestors
         )
         
         # Store and save
@@ -186,35 +502,86 @@ class AnchorRegistry:
         return anchor
     
     def _save_anchor(self, anchor: DesignAnchor):
-        """Save anchor to file."""
-        filepath = self.storage_path / f"{anchor.anchor_id}.json"
-        with open(filepath, 'w') as f:
-            f.write(anchor.to_json())
+        """Append anchor to the anchor log and index it."""
+        record = anchor.to_canonical_bytes()
+        with open(self.storage_path / self.LOG_FILE, 'ab') as f:
+            # Lock from finding the end of the log until the record is out,
+            # so another process cannot append in between
+            if FCNTL_AVAILABLE:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            offset = f.seek(0, os.SEEK_END)
+            f.write(record + b'\n')
+            f.flush()
+            self._unsynced += 1
+            if self._unsynced >= self.FSYNC_EVERY:
+                os.fsync(f.fileno())
+                self._unsynced = 0
+        
+        self._append_index(anchor, offset, len(record))
+        if self._index is not None:
+            self._index[anchor.anchor_id] = (anchor.typology, anchor.timestamp,
+                                             offset, len(record))
     
     def get_anchor(self, anchor_id: str) -> Optional[DesignAnchor]:
-        """Retrieve anchor by ID."""
-        return self._anchors.get(anchor_id)
+        """Retrieve anchor by ID, loading it from storage if needed."""
+        return self._anchors.get(anchor_id) or self._load_one(anchor_id)
     
-    def get_design_lineage(self, anchor_id: str) -> List[DesignAnchor]:
-        """Get full lineage of a design (all iterations)."""
+    def _ancestor_ids(self, anchor: DesignAnchor) -> Tuple[str, ...]:
+        """Ancestor chain of an anchor, walking parents for legacy anchors."""
+        if anchor.ancestors:
+            return anchor.ancestors
+        return tuple(a.anchor_id for a in self._walk_lineage(anchor))
+    
+    def _walk_lineage(self, current: Optional[DesignAnchor]) -> List[DesignAnchor]:
+        """Follow parent links back to the root (anchors without a stored chain)."""
         lineage = []
-        current = self._anchors.get(anchor_id)
         
         while current:
             lineage.append(current)
             if current.parent_anchor:
-                current = self._anchors.get(current.parent_anchor)
+                current = self.get_anchor(current.parent_anchor)
             else:
                 break
         
         return list(reversed(lineage))
     
+    def get_design_lineage(self, anchor_id: str) -> List[DesignAnchor]:
+        """Get full lineage of a design (all iterations)."""
+        anchor = self.get_anchor(anchor_id)
+        if anchor is None or not anchor.ancestors:
+            return self._walk_lineage(anchor)
+        
+        lineage = [self.get_anchor(a) for a in anchor.ancestors]
+        # Like the parent walk, stop at the most recent missing ancestor
+        if None in lineage:
+            missing = len(lineage) - 1 - lineage[::-1].index(None)
+            lineage = lineage[missing + 1:]
+        return lineage
+    
     def list_anchors(self, typology: str = None) -> List[DesignAnchor]:
         """List all anchors, optionally filtered by typology."""
-        anchors = list(self._anchors.values())
-        if typology:
-            anchors = [a for a in anchors if a.typology == typology]
-        return sorted(anchors, key=lambda a: a.timestamp, reverse=True)
+        # Filter and sort on the index columns so only matching anchors are loaded
+        ids, typologies, timestamps = self._index_columns()
+        rows = np.flatnonzero(typologies == typology) if typology else np.arange(len(ids))
+        
+        # Newest first; ties keep index order, as a stable reverse sort would
+        order = np.argsort(timestamps[rows][::-1], kind='stable')[::-1]
+        rows = rows[::-1][order]
+        
+        anchors = map(self.get_anchor, [ids[i] for i in rows.tolist()])
+        return [a for a in anchors if a]
+    
+    def _index_columns(self) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """Return the index as parallel anchor_id, typology and timestamp columns."""
+        index = self._load_index()
+        if self._columns is None or len(self._columns[0]) != len(index):
+            entries = index.values()
+            self._columns = (
+                list(index),
+                np.array([entry[0] for entry in entries], dtype=str),
+                np.array([entry[1] for entry in entries], dtype=str)
+            )
+        return self._columns
 
 
 class MockLedgerClient:
@@ -223,9 +590,13 @@ class MockLedgerClient:
     Prepares and simulates ledger submissions.
     """
     
-    def __init__(self, network: str = "mock_harmonic_chain"):
+    def __init__(self, network: str = "mock_harmonic_chain", hash_algo: str = 'sha256'):
         self.network = network
+        # Algorithm behind the anchors' hashes and the mock transaction hashes
+        self.hash_algo = _check_hash_algo(hash_algo)
         self.submissions: List[Dict] = []
+        # First receipt per design hash, for O(1) verification
+        self._by_design_hash: Dict[str, Dict] = {}
     
     def prepare_submission(self, anchor: DesignAnchor) -> Dict:
         """
@@ -235,6 +606,7 @@ class MockLedgerClient:
         return {
             'network': self.network,
             'transaction_type': 'DESIGN_ANCHOR',
+            'hash_algo': self.hash_algo,
             'payload': {
                 'design_hash': anchor.design_hash,
                 'geometry_hash': anchor.geometry_hash,
@@ -255,14 +627,15 @@ class MockLedgerClient:
         submission = self.prepare_submission(anchor)
         
         # Simulate transaction
-        tx_hash = hashlib.sha256(
-            f"{anchor.design_hash}:{time.time()}".encode()
-        ).hexdigest()
+        tx = _HASH_ALGOS[self.hash_algo](anchor.design_hash.encode('ascii'))
+        tx.update(b':')
+        tx.update(time.time_ns().to_bytes(8, 'little'))
+        tx_hash = tx.hexdigest()
         
         receipt = {
             'transaction_hash': tx_hash,
             'block_number': 18472931,  # Mock block
-            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'timestamp': fast_utc_isoformat(),
             'status': 'confirmed',
             'gas_used': 142350,
             'anchor_id': anchor.anchor_id,
@@ -270,19 +643,20 @@ class MockLedgerClient:
         }
         
         self.submissions.append(receipt)
+        self._by_design_hash.setdefault(anchor.design_hash, receipt)
         return receipt
     
     def verify_on_ledger(self, design_hash: str) -> Optional[Dict]:
         """Verify a design hash exists on the ledger."""
-        for submission in self.submissions:
-            if submission['design_hash'] == design_hash:
-                return {
-                    'verified': True,
-                    'transaction_hash': submission['transaction_hash'],
-                    'block_number': submission['block_number'],
-                    'timestamp': submission['timestamp']
-                }
-        return None
+        submission = self._by_design_hash.get(design_hash)
+        if submission is None:
+            return None
+        return {
+            'verified': True,
+            'transaction_hash': submission['transaction_hash'],
+            'block_number': submission['block_number'],
+            'timestamp': submission['timestamp']
+        }
 
 
 class TerraCareAnchor:
@@ -291,9 +665,9 @@ class TerraCareAnchor:
     Combines hashing, registry, and ledger preparation.
     """
     
-    def __init__(self, storage_path: Path = None):
-        self.registry = AnchorRegistry(storage_path)
-        self.ledger = MockLedgerClient()
+    def __init__(self, storage_path: Path = None, hash_algo: str = 'sha256'):
+        self.registry = AnchorRegistry(storage_path, hash_algo)
+        self.ledger = MockLedgerClient(hash_algo=hash_algo)
         self.hasher = DesignHasher()
     
     def anchor_design(self, typology: str, parameters: Dict,
@@ -322,7 +696,39 @@ class TerraCareAnchor:
             compliance_status=compliance_report,
             target_frequency=target_frequency
         )
+        return self._anchor_result(anchor, submit_to_ledger)
+    
+    def anchor_designs_batch(self, jobs: List[Dict],
+                             max_workers: Optional[int] = None) -> List[Dict]:
+        """
+        Anchor many designs at once.
+        
+        Each job is a dict of anchor_design keyword arguments. Parameter
+        and geometry hashing runs on a thread pool (hashlib releases the
+        GIL for large buffers); registry inserts stay serial and in order.
+        
+        Returns:
+            One anchoring result per job, in job order
+        """
+        def hash_job(job: Dict) -> Tuple[str, str]:
+            return (DesignHasher.hash_parameters(job['parameters'], self.registry.hash_algo),
+                    DesignHasher.hash_geometry(job['geometry_data'], self.registry.hash_algo))
         
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            hashes = list(executor.map(hash_job, jobs))
+        
+        results = []
+        for job, (param_hash, geometry_hash) in zip(jobs, hashes):
+            anchor = self.registry._create_hashed_anchor(
+                job['typology'], job['parameters'], param_hash, geometry_hash,
+                job['compliance_report'], job.get('target_frequency', 7.83),
+                None, None
+            )
+            results.append(self._anchor_result(anchor, job.get('submit_to_ledger', False)))
+        return results
+    
+    def _anchor_result(self, anchor: DesignAnchor, submit_to_ledger: bool) -> Dict:
+        """Build the anchoring result, submitting to the ledger if requested."""
         result = {
             'anchor_id': anchor.anchor_id,
             'design_hash': anchor.design_hash,
@@ -355,7 +761,7 @@ class TerraCareAnchor:
         if not anchor:
             return {'valid': False, 'error': 'Anchor not found'}
         
-        current_hash = self.hasher.hash_geometry(current_geometry)
+        current_hash = self.hasher.hash_geometry(current_geometry, self.registry.hash_algo)
         
         return {
             'valid': current_hash == anchor.geometry_hash,
@@ -363,7 +769,7 @@ class TerraCareAnchor:
             'stored_hash': anchor.geometry_hash,
             'current_hash': current_hash,
             'design_hash': anchor.design_hash,
-            'timestamp_verified': datetime.now(timezone.utc).isoformat()
+            'timestamp_verified': fast_utc_isoformat()
         }
     
     def get_design_history(self, anchor_id: str) -> List[Dict]:
@@ -373,10 +779,17 @@ class TerraCareAnchor:
 
 
 # Convenience functions
+@lru_cache(maxsize=1)
+def _default_anchor() -> TerraCareAnchor:
+    """Shared TerraCareAnchor for the convenience functions, so the default
+    registry is opened once per process rather than once per call."""
+    return TerraCareAnchor()
+
+
 def anchor_single_pod(diameter: float = 6.5, height: float = 3.2,
                      geometry_data: Dict = None, compliance: Dict = None) -> Dict:
     """Quick anchor for SinglePod."""
-    terracare = TerraCareAnchor()
+    terracare = _default_anchor()
     
     params = {'diameter': diameter, 'height': height}
     geom = geometry_data or {'type': 'single_pod', 'diameter': diameter, 'height': height}
@@ -388,7 +801,7 @@ def anchor_single_pod(diameter: float = 6.5, height: float = 3.2,
 def anchor_multi_pod_cluster(pod_count: int = 4, arrangement_radius: float = 12.0,
                             geometry_data: Dict = None, compliance: Dict = None) -> Dict:
     """Quick anchor for MultiPodCluster."""
-    terracare = TerraCareAnchor()
+    terracare = _default_anchor()
     
     params = {'pod_count': pod_count, 'arrangement_radius': arrangement_radius}
     geom = geometry_data or {
@@ -404,7 +817,7 @@ def anchor_multi_pod_cluster(pod_count: int = 4, arrangement_radius: float = 12.
 def anchor_organic_family(length: float = 15.0, width: float = 5.6, levels: int = 2,
                          geometry_data: Dict = None, compliance: Dict = None) -> Dict:
     """Quick anchor for OrganicFamily."""
-    terracare = TerraCareAnchor()
+    terracare = _default_anchor()
     
     params = {'length': length, 'width': width, 'levels': levels}
     geom = geometry_data or {
@@ -7,15 +7,38 @@ import os
 import sys
 import time
 import json
-import uuid
+import secrets
 import shutil
+import mimetypes
+import zipfile
+import hashlib
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import dataclasses
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
+from urllib.parse import quote
 
-from flask import Flask, render_template, request, jsonify, send_file, redirect, url_for
+from flask import Flask, render_template, request, jsonify, send_file, url_for
 from werkzeug.utils import secure_filename
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -25,6 +48,7 @@ from compliance.eurocodes import ComplianceValidator
 from resonance.acoustic_engine import full_acoustic_analysis
 from printer.generic_slicer import generate_for_printer
 from terracare.anchor import TerraCareAnchor
+from harmonic_compat import DATACLASS_SLOTS
 from docs_engine import (
     create_drawing_set,
     PDFDrawingSet,
@@ -36,50 +60,267 @@ from docs_engine import (
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'harmonic-habitats-secret-key'
-app.config['UPLOAD_FOLDER'] = Path(__file__).parent / 'uploads'
-app.config['OUTPUT_FOLDER'] = Path(__file__).parent / 'outputs'
+# Either folder can be moved, e.g. uploads onto tmpfs (/dev/shm) since
+# they are only read while a job is analyzed
+app.config['UPLOAD_FOLDER'] = Path(os.environ.get('HH_UPLOAD_FOLDER',
+                                                  Path(__file__).parent / 'uploads'))
+app.config['OUTPUT_FOLDER'] = Path(os.environ.get('HH_OUTPUT_FOLDER',
+                                                  Path(__file__).parent / 'outputs'))
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+# Serialize JSON responses in insertion order rather than sorting keys
+app.json.sort_keys = False
+# Behind Apache/lighttpd, let the front server stream downloads (X-Sendfile)
+app.config['USE_X_SENDFILE'] = os.environ.get('USE_X_SENDFILE', '').lower() in ('1', 'true', 'yes')
+# Behind nginx: internal location aliased to OUTPUT_FOLDER (X-Accel-Redirect)
+app.config['X_ACCEL_REDIRECT_PREFIX'] = os.environ.get('X_ACCEL_REDIRECT_PREFIX', '')
+
+# Compress pages and JSON responses when Flask-Compress is installed.
+# send_file downloads stream straight through and are left as they are.
+if COMPRESS_AVAILABLE:
+    app.config['COMPRESS_MIMETYPES'] = ['text/html', 'text/css', 'application/javascript',
+                                        'application/json']
+    app.config['COMPRESS_LEVEL'] = 6
+    Compress(app)
 
 # Create folders
-app.config['UPLOAD_FOLDER'].mkdir(exist_ok=True)
-app.config['OUTPUT_FOLDER'].mkdir(exist_ok=True)
+app.config['UPLOAD_FOLDER'].mkdir(parents=True, exist_ok=True)
+app.config['OUTPUT_FOLDER'].mkdir(parents=True, exist_ok=True)
+
+ALLOWED_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.webp', '.bmp'})
+UPLOAD_CHUNK_SIZE = 1 << 20
+ZIP_WRITE_BUFFER = 1 << 20
+# Stored rather than deflated in the documentation zip
+PRECOMPRESSED_SUFFIXES = frozenset({'.pdf', '.png', '.jpg', '.jpeg', '.gif', '.webp', '.zip', '.gz'})
 
-ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp', 'bmp'}
+# Image analyses of recent uploads, keyed by (content SHA-256, filename).
+# ImageSeeder reads the file name as well as the image, so both form the key.
+SEEDER_CACHE_SIZE = 256
+_seeder_cache: 'OrderedDict[Tuple[str, str], Tuple[str, Dict, StyleDNA]]' = OrderedDict()
+_seeder_cache_lock = threading.Lock()
 
 
 def allowed_file(filename):
     """Check if file extension is allowed."""
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return os.path.splitext(filename)[1].lower() in ALLOWED_EXTENSIONS
+
+
+def job_dir(job_id: str) -> Path:
+    """Output folder of a job."""
+    return app.config['OUTPUT_FOLDER'] / job_id
+
 
+def results_path(job_id: str) -> Path:
+    """results.json of a job; it exists once the job has completed."""
+    return app.config['OUTPUT_FOLDER'] / job_id / 'results.json'
+
+
+def failed_path(job_id: str) -> Path:
+    """failed.json of a job; it exists if the job failed or was interrupted."""
+    return app.config['OUTPUT_FOLDER'] / job_id / 'failed.json'
+
+
+@lru_cache(maxsize=4)
+def resolved_folder(folder: Path) -> Path:
+    """Absolute, symlink-free form of a configured folder (resolved once)."""
+    return folder.resolve()
+
+
+def new_job_id() -> str:
+    """Random 64-bit job ID, claimed by creating its output folder."""
+    while True:
+        job_id = secrets.token_hex(8)
+        try:
+            job_dir(job_id).mkdir()
+            return job_id
+        except FileExistsError:
+            continue
 
-def detect_typology_from_image(image_path: Path) -> Tuple[str, Dict]:
+
+# Style DNA values that select each typology
+MULTI_POD_CLUSTERING = frozenset({'distributed_village', 'circular_village', 'multi_unit'})
+ORGANIC_FORMS = frozenset({'flowing_organic', 'organic', 'curved'})
+CIRCULAR_FORMS = frozenset({'circular_pod', 'circular', 'dome'})
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class StyleDNA:
+    """The style DNA fields the webapp reads, lowercased once."""
+    form_language: str = ''
+    clustering: str = ''
+    curvature: str = ''
+    scale: str = ''
+    levels: Optional[int] = None
+    
+    @classmethod
+    def from_dict(cls, style_dna: Dict) -> 'StyleDNA':
+        """Build from an ImageSeeder style_dna dict."""
+        return cls(
+            form_language=str(style_dna.get('form_language', '')).lower(),
+            clustering=str(style_dna.get('clustering', '')).lower(),
+            curvature=str(style_dna.get('curvature', '')).lower(),
+            scale=str(style_dna.get('scale', '')).lower(),
+            levels=style_dna.get('levels')
+        )
+
+
+def detect_typology_from_image(image_path: Path) -> Tuple[str, Dict, StyleDNA]:
     """
     Analyze uploaded image and detect typology.
     
     Returns:
-        (typology_name, extracted_parameters)
+        (typology_name, extracted_parameters, style_dna)
     """
     seeder = ImageSeeder(image_path)
-    style_dna = seeder.style_dna
-    
-    # Map form language to typology
-    form_language = style_dna.get('form_language', '').lower()
-    clustering = style_dna.get('clustering', '').lower()
-    curvature = style_dna.get('curvature', '').lower()
+    style_dna = StyleDNA.from_dict(seeder.style_dna)
+    params = seeder.to_parameters()
     
     # Detection logic
-    if clustering in ['distributed_village', 'circular_village', 'multi_unit']:
-        return 'multi_pod_cluster', seeder.to_parameters()
-    elif form_language in ['flowing_organic', 'organic', 'curved'] or curvature == 'high':
-        return 'organic_family', seeder.to_parameters()
-    elif form_language in ['circular_pod', 'circular', 'dome']:
-        return 'single_pod', seeder.to_parameters()
+    if style_dna.clustering in MULTI_POD_CLUSTERING:
+        return 'multi_pod_cluster', params, style_dna
+    elif style_dna.form_language in ORGANIC_FORMS or style_dna.curvature == 'high':
+        return 'organic_family', params, style_dna
+    elif style_dna.form_language in CIRCULAR_FORMS:
+        return 'single_pod', params, style_dna
     else:
         # Default to single_pod for unrecognized patterns
-        return 'single_pod', seeder.to_parameters()
+        return 'single_pod', params, style_dna
+
+
+# Dwelling generation runs on a background worker so uploads return at
+# once; clients poll /api/status/<job_id>.
+_job_queue: 'queue.Queue[Tuple[str, Dict, str, Path]]' = queue.Queue()
+_job_worker: Optional[threading.Thread] = None
+_job_worker_lock = threading.Lock()
 
+# Status responses of recent jobs, JSON-encoded once per state change so
+# polls are served from memory. Older jobs fall back to results.json.
+# Each is stored with its ETag so unchanged polls get a 304.
+JOB_STATE_SIZE = 1024
+_job_states: 'OrderedDict[str, Tuple[str, bytes]]' = OrderedDict()
+_job_states_lock = threading.Lock()
+
+
+def _json_default(obj):
+    """
+    Encode values JSON has no type for: dataclasses as dicts, NumPy
+    values as lists/numbers, anything else as its str().
+    """
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    return str(obj)
+
+
+def encode_json(data, pretty: bool = False) -> bytes:
+    """
+    Encode data as JSON, via orjson when it is installed. Both encoders
+    go through _json_default, so the output has the same shape either way.
+    """
+    if ORJSON_AVAILABLE:
+        option = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY |
+                  orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME)
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_json_default, option=option)
+    # json.dumps, unlike json.dump, can use the C encoder (when not indenting)
+    return json.dumps(data, indent=2 if pretty else None, default=_json_default).encode('utf-8')
+
+
+def _store_job_state(job_id: str, body: bytes) -> str:
+    """
+    Record an encoded status response, tagged with a digest of its body.
+    Returns the tag, which is used as the response's ETag.
+    """
+    etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+    with _job_states_lock:
+        _job_states[job_id] = (etag, body)
+        _job_states.move_to_end(job_id)
+        if len(_job_states) > JOB_STATE_SIZE:
+            _job_states.popitem(last=False)
+    return etag
+
+
+def set_job_state(job_id: str, state: Dict):
+    """Record a job's status response."""
+    _store_job_state(job_id, encode_json(state))
+
+
+def fail_job(job_id: str, error: str):
+    """Mark a job as failed, in memory and in its output folder."""
+    state = {'status': 'failed', 'error': error}
+    set_job_state(job_id, state)
+    try:
+        write_json(failed_path(job_id), state, pretty=False)
+    except OSError as e:
+        print(f"Warning: Could not record failure of job {job_id}: {e}")
+
+
+def report_step(job_id: str, step: str):
+    """Mark a job as running the given pipeline step."""
+    set_job_state(job_id, {'status': 'running', 'step': step})
+
+
+def write_json(path: Path, data, pretty: bool = True):
+    """Write data as JSON; see encode_json."""
+    Path(path).write_bytes(encode_json(data, pretty))
+
+
+def read_json(path: Path):
+    """Read a JSON file, parsing with orjson when it is installed."""
+    data = Path(path).read_bytes()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 hex digest of a file, read in 1 MB chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def save_upload(file, path: Path) -> str:
+    """
+    Stream an uploaded file to disk in 1 MB chunks.
+    Returns the SHA-256 hex digest of its contents, computed on the way.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'wb', buffering=UPLOAD_CHUNK_SIZE) as dst:
+        for chunk in iter(lambda: file.stream.read(UPLOAD_CHUNK_SIZE), b''):
+            digest.update(chunk)
+            dst.write(chunk)
+    return digest.hexdigest()
 
-def extract_parameters_from_analysis(style_dna: Dict) -> Dict:
+
+def detect_typology_cached(image_path: Path, filename: str,
+                           digest: Optional[str] = None) -> Tuple[str, Dict, StyleDNA]:
+    """
+    detect_typology_from_image, memoized for re-submitted images.
+    Cached results are shared, so callers must not modify them.
+    """
+    key = (digest or file_sha256(image_path), filename)
+    with _seeder_cache_lock:
+        cached = _seeder_cache.get(key)
+        if cached is not None:
+            _seeder_cache.move_to_end(key)
+            return cached
+    
+    # Analyzed without the lock held; a concurrent miss on the same key
+    # just stores an equal result
+    detected = detect_typology_from_image(image_path)
+    with _seeder_cache_lock:
+        _seeder_cache[key] = detected
+        _seeder_cache.move_to_end(key)
+        if len(_seeder_cache) > SEEDER_CACHE_SIZE:
+            _seeder_cache.popitem(last=False)
+    return detected
+
+
+def extract_parameters_from_analysis(style_dna: StyleDNA) -> Dict:
     """Extract specific parameters from image analysis."""
     params = {
         'cell_radius': 2.5,
@@ -88,7 +329,7 @@ def extract_parameters_from_analysis(style_dna: Dict) -> Dict:
     }
     
     # Extract from style_dna
-    scale = style_dna.get('scale', '')
+    scale = style_dna.scale
     if 'large' in scale or 'dwelling' in scale:
         params['diameter'] = 6.5
         params['height'] = 3.2
@@ -97,28 +338,192 @@ def extract_parameters_from_analysis(style_dna: Dict) -> Dict:
         params['height'] = 2.8
     
     # Extract levels if mentioned
-    if 'levels' in style_dna:
-        params['levels'] = style_dna.get('levels', 1)
+    if style_dna.levels is not None:
+        params['levels'] = style_dna.levels
     
     # Extract curvature info
-    curvature = style_dna.get('curvature', 'medium')
-    params['curvature'] = curvature
+    params['curvature'] = style_dna.curvature or 'medium'
     
     return params
 
 
-def generate_dwelling(typology: str, params: Dict, job_id: str) -> Dict:
+@lru_cache(maxsize=1)
+def shared_validator() -> ComplianceValidator:
+    """Process-wide ComplianceValidator; it is read-only once built."""
+    return ComplianceValidator()
+
+
+@lru_cache(maxsize=1)
+def shared_terracare() -> TerraCareAnchor:
+    """Process-wide TerraCareAnchor. Anchor with _anchor_lock held."""
+    return TerraCareAnchor()
+
+
+# AnchorRegistry appends to a shared log and is not thread-safe
+_anchor_lock = threading.Lock()
+
+
+def check_compliance(validator: Optional[ComplianceValidator] = None) -> Dict:
+    """Compliance summary for a generated dwelling."""
+    validator = validator or shared_validator()
+    return {
+        'schumann_aligned': True,
+        'ntc2018': validator.ntc.seismic_zone.name,
+        'overall_valid': True
+    }
+
+
+def analyze_acoustics(typology: str, params: Dict, geometry: Dict) -> Dict:
+    """Run the acoustic analysis for a generated dwelling."""
+    if typology == 'single_pod':
+        return full_acoustic_analysis('single_pod', 
+            diameter=geometry['diameter'],
+            height=3.2
+        )
+    elif typology == 'multi_pod_cluster':
+        return full_acoustic_analysis('multi_pod_cluster',
+            pod_diameter=6.0,
+            arrangement_radius=12.0
+        )
+    else:
+        return full_acoustic_analysis('organic_family',
+            length=params.get('length', 15.0),
+            width=params.get('width', 5.6),
+            levels=params.get('levels', 2)
+        )
+
+
+def printer_parameters(typology: str, params: Dict, geometry: Dict) -> Dict:
+    """Geometry parameters for G-code generation."""
+    if typology == 'single_pod':
+        return {'diameter': geometry['diameter'], 'height': 3.2, 'wall_thickness': 0.30}
+    elif typology == 'multi_pod_cluster':
+        return {'pod_count': params.get('pod_count', 4), 'arrangement_radius': 12.0}
+    elif typology == 'organic_family':
+        return {'length': params.get('length', 15.0), 'width': params.get('width', 5.6)}
+    return {}
+
+
+def write_dxf_drawings(project_name: str, typology: str, geometry: Dict,
+                       docs_dir: Path, files: Dict):
+    """7a. CAD Drawings (DXF)"""
+    dxf_files = create_drawing_set(project_name, geometry, docs_dir / 'dxf')
+    files['dxf_drawings'] = {k: str(v) for k, v in dxf_files.items()}
+
+
+def write_pdf_drawings(project_name: str, typology: str, geometry: Dict,
+                       docs_dir: Path, files: Dict):
+    """7b. PDF Drawing Set"""
+    pdf_gen = PDFDrawingSet(docs_dir / 'drawing_set.pdf')
+    pdf_path = pdf_gen.generate_drawing_set(project_name, geometry, docs_dir)
+    files['pdf_drawings'] = str(pdf_path)
+
+
+def write_bim_model(project_name: str, typology: str, geometry: Dict,
+                    docs_dir: Path, files: Dict):
+    """7c. BIM Model (IFC)"""
+    ifc_path = export_geometry_to_ifc(geometry, project_name, docs_dir / 'model.ifc')
+    files['bim_ifc'] = str(ifc_path)
+
+
+def write_schedules(project_name: str, typology: str, geometry: Dict,
+                    docs_dir: Path, files: Dict):
+    """7d. Construction Schedules"""
+    sched_gen = ScheduleGenerator(project_name)
+    sched_gen.generate_from_geometry(geometry, typology)
+    csv_files = sched_gen.export_csv(docs_dir)
+    files['schedules_csv'] = {k: str(v) for k, v in csv_files.items()}
+    pdf_sched = sched_gen.export_pdf(docs_dir / 'schedules.pdf')
+    files['schedules_pdf'] = str(pdf_sched)
+
+
+def write_structural_report(project_name: str, typology: str, geometry: Dict,
+                            docs_dir: Path, files: Dict):
+    """7e. Structural Calculations"""
+    if typology == 'single_pod':
+        struct_report = calculate_single_pod_structure(
+            geometry.get('diameter', 6.5),
+            3.2, 0.30
+        )
+        files['structural_report'] = str(struct_report)
+
+
+def write_energy_reports(project_name: str, typology: str, geometry: Dict,
+                         docs_dir: Path, files: Dict):
+    """7f. Energy Report / APE"""
+    energy_files = generate_energy_report_for_typology(typology, geometry, docs_dir)
+    files['energy_reports'] = {k: str(v) for k, v in energy_files.items()}
+
+
+# (label for skip messages, stage, uses reportlab) in results['files'] order
+DOCUMENTATION_STAGES = [
+    ('DXF generation', write_dxf_drawings, False),
+    ('PDF generation', write_pdf_drawings, True),
+    ('IFC export', write_bim_model, False),
+    ('Schedules generation', write_schedules, True),
+    ('Structural calc', write_structural_report, False),
+    ('Energy report', write_energy_reports, True),
+]
+
+# reportlab is not documented as thread-safe, so stages that use it run
+# one at a time
+_reportlab_lock = threading.Lock()
+
+
+def run_documentation_stage(stage, uses_reportlab: bool, *args):
+    """Run a documentation stage, holding _reportlab_lock if it needs it."""
+    if uses_reportlab:
+        with _reportlab_lock:
+            return stage(*args)
+    return stage(*args)
+
+
+# Serializes on-demand builds of documentation zips
+_zip_lock = threading.Lock()
+
+
+def build_documentation_zip(zip_path: Path):
+    """
+    Zip a job's documentation folder, which sits next to the zip, unless
+    the zip already exists.
+    """
+    with _zip_lock:
+        if zip_path.exists():
+            return
+        
+        output_dir = zip_path.parent
+        docs_dir = output_dir / 'documentation'
+        doc_files = sorted(p for p in docs_dir.rglob('*') if p.is_file())
+        tmp_path = zip_path.with_suffix('.tmp')
+        with open(tmp_path, 'wb', buffering=ZIP_WRITE_BUFFER) as f, \
+                zipfile.ZipFile(f, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            for file_path in doc_files:
+                # Deflating already-compressed formats only costs CPU
+                if file_path.suffix.lower() in PRECOMPRESSED_SUFFIXES:
+                    compress_type = zipfile.ZIP_STORED
+                else:
+                    compress_type = zipfile.ZIP_DEFLATED
+                zipf.write(file_path, file_path.relative_to(output_dir),
+                           compress_type=compress_type)
+        os.replace(tmp_path, zip_path)
+
+
+def generate_dwelling(typology: str, params: Dict, job_id: str,
+                      validator: Optional[ComplianceValidator] = None,
+                      terracare: Optional[TerraCareAnchor] = None) -> Dict:
     """
     Generate complete dwelling from detected parameters.
     
+    The shared validator and anchor are used unless others are passed in.
+    
     Pipeline:
     1. Generate geometry
-    2. Check compliance
+    2. Check compliance    (2-4 run concurrently)
     3. Acoustic analysis
     4. Generate G-code
     5. Create anchor
     """
-    output_dir = app.config['OUTPUT_FOLDER'] / job_id
+    output_dir = job_dir(job_id)
     output_dir.mkdir(exist_ok=True)
     
     results = {
@@ -131,6 +536,7 @@ def generate_dwelling(typology: str, params: Dict, job_id: str) -> Dict:
     
     try:
         # 1. Generate Geometry
+        report_step(job_id, 'geometry')
         if typology == 'single_pod':
             pod = SinglePod(
                 diameter=params.get('diameter', 6.5),
@@ -176,146 +582,79 @@ def generate_dwelling(typology: str, params: Dict, job_id: str) -> Dict:
         
         results['geometry'] = geometry
         
-        # 2. Compliance Check
-        validator = ComplianceValidator()
-        compliance = {
-            'schumann_aligned': True,
-            'ntc2018': validator.ntc.seismic_zone.name,
-            'overall_valid': True
-        }
-        results['compliance'] = compliance
-        
-        # 3. Acoustic Analysis
+        # 2-4. Compliance, acoustics and G-code depend only on the
+        # geometry, so they run concurrently
+        report_step(job_id, 'analysis')
         frequency = params.get('target_frequency', 7.83)
-        if typology == 'single_pod':
-            acoustic = full_acoustic_analysis('single_pod', 
-                diameter=geometry['diameter'],
-                height=3.2
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            compliance_future = executor.submit(check_compliance, validator)
+            acoustic_future = executor.submit(analyze_acoustics, typology, params, geometry)
+            gcode_future = executor.submit(
+                generate_for_printer, typology, 'wasp_crane',
+                **printer_parameters(typology, params, geometry)
             )
-        elif typology == 'multi_pod_cluster':
-            acoustic = full_acoustic_analysis('multi_pod_cluster',
-                pod_diameter=6.0,
-                arrangement_radius=12.0
-            )
-        else:
-            acoustic = full_acoustic_analysis('organic_family',
-                length=params.get('length', 15.0),
-                width=params.get('width', 5.6),
-                levels=params.get('levels', 2)
-            )
-        results['acoustic'] = acoustic
+            compliance = compliance_future.result()
+            results['compliance'] = compliance
+            results['acoustic'] = acoustic_future.result()
+            gcode_result = gcode_future.result()
         
-        # 4. Generate G-code
-        geo_params = {}
-        if typology == 'single_pod':
-            geo_params = {'diameter': geometry['diameter'], 'height': 3.2, 'wall_thickness': 0.30}
-        elif typology == 'multi_pod_cluster':
-            geo_params = {'pod_count': params.get('pod_count', 4), 'arrangement_radius': 12.0}
-        elif typology == 'organic_family':
-            geo_params = {'length': params.get('length', 15.0), 'width': params.get('width', 5.6)}
-        
-        gcode_result = generate_for_printer(typology, 'wasp_crane', **geo_params)
-        
-        # Save G-code
+        # Save G-code: encoded once and written in binary mode as a single
+        # write, so multi-MB toolpaths bypass any userland buffering
         gcode_path = output_dir / f"{typology}.gcode"
-        with open(gcode_path, 'w') as f:
-            f.write(gcode_result['gcode'])
+        gcode_path.write_bytes(gcode_result['gcode'].encode('utf-8'))
         results['files']['gcode'] = str(gcode_path)
         
         # 5. Create Terracare Anchor
-        terracare = TerraCareAnchor()
-        anchor = terracare.anchor_design(
-            typology=typology,
-            parameters=params,
-            geometry_data=geometry,
-            compliance_report=compliance,
-            target_frequency=frequency
-        )
+        report_step(job_id, 'anchor')
+        terracare = terracare or shared_terracare()
+        with _anchor_lock:
+            anchor = terracare.anchor_design(
+                typology=typology,
+                parameters=params,
+                geometry_data=geometry,
+                compliance_report=compliance,
+                target_frequency=frequency
+            )
         results['anchor'] = anchor
         
         # Save anchor JSON
         anchor_path = output_dir / 'terracare_anchor.json'
-        with open(anchor_path, 'w') as f:
-            json.dump(anchor, f, indent=2)
+        write_json(anchor_path, anchor)
         results['files']['anchor'] = str(anchor_path)
         
-        # 6. Save full report
-        report_path = output_dir / f"{typology}_report.json"
-        with open(report_path, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
-        results['files']['report'] = str(report_path)
+        # 6. Full report: written with results.json when the job completes
+        results['files']['report'] = str(output_dir / f"{typology}_report.json")
         
         # 7. Generate professional documentation
+        report_step(job_id, 'documentation')
         docs_dir = output_dir / 'documentation'
         docs_dir.mkdir(exist_ok=True)
         
         # Define project name for documentation
         project_name = f"Harmonic_{typology.replace('_', ' ').title()}"
         
-        # 7a. CAD Drawings (DXF)
-        try:
-            dxf_files = create_drawing_set(project_name, geometry, docs_dir / 'dxf')
-            results['files']['dxf_drawings'] = {k: str(v) for k, v in dxf_files.items()}
-        except Exception as e:
-            print(f"DXF generation skipped: {e}")
-        
-        # 7b. PDF Drawing Set
-        try:
-            pdf_gen = PDFDrawingSet(docs_dir / 'drawing_set.pdf')
-            pdf_path = pdf_gen.generate_drawing_set(project_name, geometry, docs_dir)
-            results['files']['pdf_drawings'] = str(pdf_path)
-        except Exception as e:
-            print(f"PDF generation skipped: {e}")
-        
-        # 7c. BIM Model (IFC)
-        try:
-            ifc_path = export_geometry_to_ifc(geometry, project_name, docs_dir / 'model.ifc')
-            results['files']['bim_ifc'] = str(ifc_path)
-        except Exception as e:
-            print(f"IFC export skipped: {e}")
-        
-        # 7d. Construction Schedules
-        try:
-            sched_gen = ScheduleGenerator(project_name)
-            sched_gen.generate_from_geometry(geometry, typology)
-            csv_files = sched_gen.export_csv(docs_dir)
-            results['files']['schedules_csv'] = {k: str(v) for k, v in csv_files.items()}
-            pdf_sched = sched_gen.export_pdf(docs_dir / 'schedules.pdf')
-            results['files']['schedules_pdf'] = str(pdf_sched)
-        except Exception as e:
-            print(f"Schedules generation skipped: {e}")
-        
-        # 7e. Structural Calculations
-        try:
-            if typology == 'single_pod':
-                struct_report = calculate_single_pod_structure(
-                    geometry.get('diameter', 6.5),
-                    3.2, 0.30
-                )
-                results['files']['structural_report'] = str(struct_report)
-        except Exception as e:
-            print(f"Structural calc skipped: {e}")
-        
-        # 7f. Energy Report / APE
-        try:
-            energy_files = generate_energy_report_for_typology(typology, geometry, docs_dir)
-            results['files']['energy_reports'] = {k: str(v) for k, v in energy_files.items()}
-        except Exception as e:
-            print(f"Energy report skipped: {e}")
+        # 7a-7f. Drawings, BIM model, schedules, structural and energy
+        # reports are independent, so they are generated concurrently
+        # (the reportlab PDF stages one at a time). Each stage fills its
+        # own dict, kept even if the stage fails part-way.
+        with ThreadPoolExecutor(max_workers=len(DOCUMENTATION_STAGES)) as executor:
+            stages = []
+            for label, stage, uses_reportlab in DOCUMENTATION_STAGES:
+                stage_files = {}
+                future = executor.submit(run_documentation_stage, stage, uses_reportlab,
+                                         project_name, typology, geometry,
+                                         docs_dir, stage_files)
+                stages.append((label, stage_files, future))
+            
+            for label, stage_files, future in stages:
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"{label} skipped: {e}")
+                results['files'].update(stage_files)
         
-        # Create zip file of all documentation
-        try:
-            import zipfile
-            zip_path = output_dir / f"{typology}_documentation.zip"
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for root, dirs, files in os.walk(docs_dir):
-                    for file in files:
-                        file_path = Path(root) / file
-                        arcname = file_path.relative_to(output_dir)
-                        zipf.write(file_path, arcname)
-            results['files']['documentation_zip'] = str(zip_path)
-        except Exception as e:
-            print(f"Zip creation skipped: {e}")
+        # The documentation zip is built on its first download
+        results['files']['documentation_zip'] = str(output_dir / f"{typology}_documentation.zip")
         
         results['success'] = True
         
@@ -341,6 +680,87 @@ def create_mock_3d_preview(typology: str, output_dir: Path) -> str:
     return str(preview_path)
 
 
+def enqueue_generation_job(typology: str, params: Dict, job_id: str, upload_path: Path):
+    """Queue a dwelling for background generation, starting the worker on first use."""
+    global _job_worker
+    with _job_worker_lock:
+        if _job_worker is None:
+            _job_worker = threading.Thread(target=generation_worker,
+                                           name='generation-worker', daemon=True)
+            _job_worker.start()
+    set_job_state(job_id, {'status': 'pending'})
+    _job_queue.put((typology, params, job_id, upload_path))
+
+
+def generation_worker():
+    """Run queued generation jobs one at a time, in arrival order."""
+    while True:
+        typology, params, job_id, upload_path = _job_queue.get()
+        try:
+            validator = shared_validator()
+            terracare = shared_terracare()
+        except Exception as e:
+            fail_job(job_id, str(e))
+            continue
+        
+        run_generation_job(typology, params, job_id, upload_path, validator, terracare)
+
+
+def run_generation_job(typology: str, params: Dict, job_id: str, upload_path: Path,
+                       validator: Optional[ComplianceValidator] = None,
+                       terracare: Optional[TerraCareAnchor] = None):
+    """Generate a dwelling and store its results."""
+    try:
+        results = generate_dwelling(typology, params, job_id, validator, terracare)
+        results['original_image'] = str(upload_path)
+        
+        if not results['success']:
+            fail_job(job_id, results.get('error', 'Generation failed'))
+            return
+        
+        # Create 3D preview (mock for now)
+        preview_path = create_mock_3d_preview(typology, job_dir(job_id))
+        results['preview_image'] = preview_path
+        
+        # Store results (or database in production). Written to a temporary
+        # file first so status polls never see a partial results.json. The
+        # downloadable report is the same document, linked under its own name.
+        results_file = results_path(job_id)
+        tmp_file = results_file.with_suffix('.tmp')
+        write_json(tmp_file, results)
+        try:
+            os.link(tmp_file, results['files']['report'])
+        except OSError:
+            shutil.copyfile(tmp_file, results['files']['report'])
+        os.replace(tmp_file, results_file)
+        # Serve the stored results.json, so the response (and its ETag) is
+        # the same as after this job leaves memory
+        _store_job_state(job_id, completed_status(job_id, results_version(job_id)))
+        
+    except Exception as e:
+        fail_job(job_id, str(e))
+
+
+# The job queue lives in this process, so jobs still queued or running when
+# it stops are lost. Their folders have neither results.json nor failed.json.
+INTERRUPTED_ERROR = 'Interrupted by a server restart; please upload the image again'
+
+
+def mark_interrupted_jobs():
+    """Mark jobs left unfinished by a previous run of the server as failed."""
+    state = {'status': 'failed', 'error': INTERRUPTED_ERROR}
+    with os.scandir(app.config['OUTPUT_FOLDER']) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            if results_path(entry.name).exists() or failed_path(entry.name).exists():
+                continue
+            write_json(failed_path(entry.name), state, pretty=False)
+
+
+mark_interrupted_jobs()
+
+
 @app.route('/')
 def index():
     """Serve upload form."""
@@ -362,123 +782,216 @@ def upload():
     
     try:
         # Generate unique job ID
-        job_id = str(uuid.uuid4())[:8]
+        job_id = new_job_id()
         
         # Save uploaded file
         filename = secure_filename(file.filename)
         upload_path = app.config['UPLOAD_FOLDER'] / f"{job_id}_{filename}"
-        file.save(upload_path)
+        digest = save_upload(file, upload_path)
         
         # Detect typology from image
-        typology, base_params = detect_typology_from_image(upload_path)
+        typology, base_params, style_dna = detect_typology_cached(upload_path, filename, digest)
         
         # Extract additional parameters
-        seeder = ImageSeeder(upload_path)
-        style_params = extract_parameters_from_analysis(seeder.style_dna)
+        style_params = extract_parameters_from_analysis(style_dna)
         
         # Merge parameters
         params = {**base_params, **style_params}
         
-        # Generate dwelling
-        results = generate_dwelling(typology, params, job_id)
-        results['original_image'] = str(upload_path)
-        
-        if not results['success']:
-            return jsonify({'error': results.get('error', 'Generation failed')}), 500
-        
-        # Create 3D preview (mock for now)
-        preview_path = create_mock_3d_preview(typology, app.config['OUTPUT_FOLDER'] / job_id)
-        results['preview_image'] = preview_path
-        
-        # Store results in session (or database in production)
-        results_file = app.config['OUTPUT_FOLDER'] / job_id / 'results.json'
-        with open(results_file, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        # Generate dwelling in the background; the client polls for status
+        enqueue_generation_job(typology, params, job_id, upload_path)
         
-        # Redirect to results page
-        return redirect(url_for('results', job_id=job_id))
+        return jsonify({
+            'job_id': job_id,
+            'status_url': url_for('job_status', job_id=job_id),
+            'results_url': url_for('results', job_id=job_id)
+        }), 202
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+def results_version(job_id: str) -> Optional[int]:
+    """Modification time (ns) of a job's results.json, or None if it has none."""
+    try:
+        return results_path(job_id).stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=1024)
+def read_results(job_id: str, version: int) -> Dict:
+    """
+    Parsed results.json, cached per file version.
+    Cached results are shared, so callers must not modify them.
+    """
+    return read_json(results_path(job_id))
+
+
+def load_results(job_id: str) -> Optional[Dict]:
+    """Results of a completed job, or None if there are none."""
+    version = results_version(job_id)
+    if version is None:
+        return None
+    return read_results(job_id, version)
+
+
+# Pending page text for each pipeline step reported by report_step
+STEP_MESSAGES = {
+    'geometry': 'Generating geometry...',
+    'analysis': 'Running compliance, acoustics and G-code...',
+    'anchor': 'Anchoring design...',
+    'documentation': 'Preparing documentation...'
+}
+
+
+def job_state(job_id: str) -> Optional[Dict]:
+    """
+    Status of a job tracked in memory or recorded as failed, or None if
+    neither knows it.
+    """
+    with _job_states_lock:
+        state = _job_states.get(job_id)
+    if state is not None:
+        return json.loads(state[1])
+    try:
+        return read_json(failed_path(job_id))
+    except FileNotFoundError:
+        return None
+
+
 @app.route('/results/<job_id>')
 def results(job_id):
     """Display results page."""
-    results_file = app.config['OUTPUT_FOLDER'] / job_id / 'results.json'
+    version = results_version(job_id)
     
-    if not results_file.exists():
-        return render_template('error.html', message='Job not found'), 404
-    
-    with open(results_file, 'r') as f:
-        results = json.load(f)
+    if version is None:
+        # Queued, running or failed jobs have no results.json yet
+        state = job_state(job_id)
+        if state is None:
+            return render_template('error.html', message='Job not found'), 404
+        if state['status'] == 'failed':
+            return render_template('error.html',
+                                   message=f"Generation failed: {state.get('error')}"), 500
+        message = STEP_MESSAGES.get(state.get('step'), 'Waiting to start...')
+        return render_template('pending.html', message=message), 202
     
+    return render_results_page(job_id, version)
+
+
+@lru_cache(maxsize=256)
+def render_results_page(job_id: str, version: int) -> str:
+    """Render a completed job's results page, cached per results version."""
+    results = read_results(job_id, version)
     return render_template('results.html', results=results, job_id=job_id)
 
 
+# Download type -> (key in results['files'], download name suffix). A
+# suffix of None keeps the stored file name.
+DOWNLOAD_TYPES = {
+    'gcode': ('gcode', None),
+    'report': ('report', None),
+    'anchor': ('anchor', None),
+    'documentation': ('documentation_zip', '_documentation.zip'),
+    'bim': ('bim_ifc', '.ifc'),
+    'drawings': ('pdf_drawings', '_drawings.pdf'),
+    'schedules': ('schedules_pdf', '_schedules.pdf'),
+    'structural': ('structural_report', '_structural.txt'),
+    'energy': ('energy_reports', None),
+}
+
+
+def send_download(path: str, download_name: Optional[str] = None):
+    """
+    Send a generated file as an attachment. With X_ACCEL_REDIRECT_PREFIX set,
+    files under OUTPUT_FOLDER are handed to nginx instead of read here.
+    """
+    prefix = app.config['X_ACCEL_REDIRECT_PREFIX']
+    if prefix:
+        try:
+            rel_path = Path(path).resolve().relative_to(
+                resolved_folder(app.config['OUTPUT_FOLDER']))
+        except ValueError:
+            rel_path = None  # Outside the output folder; serve it directly
+        if rel_path is not None:
+            name = download_name or Path(path).name
+            response = app.response_class()
+            response.mimetype = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+            response.headers.set('Content-Disposition', 'attachment', filename=name)
+            response.headers['X-Accel-Redirect'] = (prefix.rstrip('/') + '/'
+                                                    + quote(rel_path.as_posix()))
+            return response
+    
+    return send_file(path, as_attachment=True, download_name=download_name)
+
+
 @app.route('/download/<job_id>/<file_type>')
 def download(job_id, file_type):
     """Download generated files."""
-    output_dir = app.config['OUTPUT_FOLDER'] / job_id
+    if file_type not in DOWNLOAD_TYPES:
+        return jsonify({'error': 'File not found'}), 404
     
     # Load results to get file paths
-    results_file = output_dir / 'results.json'
-    if not results_file.exists():
+    results = load_results(job_id)
+    if results is None:
         return jsonify({'error': 'Job not found'}), 404
     
-    with open(results_file, 'r') as f:
-        results = json.load(f)
-    
-    files = results.get('files', {})
-    
-    # Basic files
-    if file_type == 'gcode' and 'gcode' in files:
-        return send_file(files['gcode'], as_attachment=True)
-    elif file_type == 'report' and 'report' in files:
-        return send_file(files['report'], as_attachment=True)
-    elif file_type == 'anchor' and 'anchor' in files:
-        return send_file(files['anchor'], as_attachment=True)
+    key, suffix = DOWNLOAD_TYPES[file_type]
+    path = results.get('files', {}).get(key)
+    if isinstance(path, dict):
+        # Several energy reports: serve the first
+        path = next(iter(path.values()), None)
+    if not path:
+        return jsonify({'error': 'File not found'}), 404
     
-    # Documentation files
-    elif file_type == 'documentation' and 'documentation_zip' in files:
-        return send_file(files['documentation_zip'], 
-                        as_attachment=True,
-                        download_name=f"{results.get('typology', 'dwelling')}_documentation.zip")
-    elif file_type == 'bim' and 'bim_ifc' in files:
-        return send_file(files['bim_ifc'], 
-                        as_attachment=True,
-                        download_name=f"{results.get('typology', 'dwelling')}.ifc")
-    elif file_type == 'drawings' and 'pdf_drawings' in files:
-        return send_file(files['pdf_drawings'], 
-                        as_attachment=True,
-                        download_name=f"{results.get('typology', 'dwelling')}_drawings.pdf")
-    elif file_type == 'schedules' and 'schedules_pdf' in files:
-        return send_file(files['schedules_pdf'], 
-                        as_attachment=True,
-                        download_name=f"{results.get('typology', 'dwelling')}_schedules.pdf")
-    elif file_type == 'structural' and 'structural_report' in files:
-        return send_file(files['structural_report'], 
-                        as_attachment=True,
-                        download_name=f"{results.get('typology', 'dwelling')}_structural.txt")
-    elif file_type == 'energy' and 'energy_reports' in files:
-        # Get first energy report
-        energy_files = files.get('energy_reports', {})
-        if energy_files:
-            first_file = list(energy_files.values())[0]
-            return send_file(first_file, as_attachment=True)
+    if key == 'documentation_zip':
+        try:
+            build_documentation_zip(Path(path))
+        except Exception as e:
+            return jsonify({'error': f'Could not build documentation: {e}'}), 500
     
-    return jsonify({'error': 'File not found'}), 404
+    if suffix is None:
+        return send_download(path)
+    return send_download(path, f"{results.get('typology', 'dwelling')}{suffix}")
+
+
+@lru_cache(maxsize=256)
+def completed_status(job_id: str, version: int) -> bytes:
+    """Encoded status response of a completed job, cached per results version."""
+    results = read_results(job_id, version)
+    return encode_json({'status': 'complete', 'results': results})
+
+
+def status_response(body: bytes, etag: str):
+    """JSON status response, or 304 Not Modified if the client has it."""
+    response = app.response_class(body, mimetype='application/json')
+    response.set_etag(etag, weak=True)
+    # Revalidate every poll rather than trusting a cached copy
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
 
 
 @app.route('/api/status/<job_id>')
 def job_status(job_id):
     """Check job status (for polling)."""
-    results_file = app.config['OUTPUT_FOLDER'] / job_id / 'results.json'
+    with _job_states_lock:
+        state = _job_states.get(job_id)
+    if state is not None:
+        etag, body = state
+        return status_response(body, etag)
     
-    if results_file.exists():
-        with open(results_file, 'r') as f:
-            results = json.load(f)
-        return jsonify({'status': 'complete', 'results': results})
+    # Jobs no longer tracked in memory (evicted, or from before a restart)
+    version = results_version(job_id)
+    if version is not None:
+        body = completed_status(job_id, version)
+        return status_response(body, _store_job_state(job_id, body))
+    
+    try:
+        body = failed_path(job_id).read_bytes()
+    except FileNotFoundError:
+        pass
+    else:
+        return status_response(body, _store_job_state(job_id, body))
     
     return jsonify({'status': 'pending'})
 
@@ -500,4 +1013,6 @@ if __name__ == '__main__':
     print("Open browser: http://localhost:5000")
     print("="*60)
     
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # The debugger and reloader are for development only: HH_DEV=1
+    dev = os.environ.get('HH_DEV') == '1'
+    app.run(debug=dev, use_reloader=dev, host='0.0.0.0', port=5000, threaded=True)
@@ -133,7 +133,11 @@ document.addEventListener('DOMContentLoaded', function() {
 
             // Handle response
             xhr.addEventListener('load', () => {
-                if (xhr.status === 200) {
+                if (xhr.status === 202) {
+                    // Job accepted - generation runs in the background
+                    const job = JSON.parse(xhr.responseText);
+                    pollJobStatus(job.status_url, job.results_url);
+                } else if (xhr.status === 200) {
                     // Server responded with redirect or success
                     updateLoadingProgress(100, 'Complete!');
                     
@@ -215,6 +219,38 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     });
 
+    // Progress shown for each pipeline step reported by /api/status
+    const STEP_MESSAGES = {
+        geometry: { progress: 55, message: 'Generating geometry...' },
+        analysis: { progress: 75, message: 'Running compliance, acoustics and G-code...' },
+        anchor: { progress: 85, message: 'Anchoring design...' },
+        documentation: { progress: 92, message: 'Preparing documentation...' }
+    };
+
+    // Poll a background generation job until it completes or fails
+    function pollJobStatus(statusUrl, resultsUrl) {
+        fetch(statusUrl)
+            .then((response) => response.json())
+            .then((data) => {
+                if (data.status === 'complete') {
+                    updateLoadingProgress(100, 'Complete!');
+                    window.location.href = resultsUrl;
+                } else if (data.status === 'failed') {
+                    alert('Error: ' + data.error);
+                    loadingOverlay.hidden = true;
+                } else {
+                    if (data.step && STEP_MESSAGES[data.step]) {
+                        updateLoadingProgress(STEP_MESSAGES[data.step].progress,
+                                              STEP_MESSAGES[data.step].message);
+                    }
+                    setTimeout(() => pollJobStatus(statusUrl, resultsUrl), 1000);
+                }
+            })
+            .catch(() => {
+                setTimeout(() => pollJobStatus(statusUrl, resultsUrl), 2000);
+            });
+    }
+
     // Update loading progress
     function updateLoadingProgress(progress, message) {
         if (progressFill) {
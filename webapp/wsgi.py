@@ -0,0 +1,10 @@
+"""
+WSGI entry point for production servers.
+
+Generation jobs, their status and the anchor registry live in the
+serving process, so run a single worker process with several threads:
+
+    gunicorn --chdir webapp --workers 1 --threads 8 --timeout 120 wsgi:app
+"""
+
+from app import app  # noqa: F401